@@ -3,16 +3,23 @@ Campaign Pusher module.
 Adds validated leads to Instantly (email) and Prosp (LinkedIn) campaigns.
 
 Features:
-- Immediate status tracking: Each successful push updates DB immediately
+- Status tracking: Successful pushes are written to the DB right away (Prosp in small batches)
 - Resume capability: Skips already-pushed leads on restart
 - Retry queue: Failed leads are retried at the end with longer delays
 """
 
+import math
+import random
 import time
+from collections import deque
 import requests
-from typing import List, Dict, Any, Tuple
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, Any, Tuple, Iterator, Callable, Optional, Mapping
+from concurrent.futures import ThreadPoolExecutor
+import queue
 import threading
+from urllib.parse import urlsplit
+from types import MappingProxyType
 
 from .config import (
     INSTANTLY_API_KEY,
@@ -24,31 +31,246 @@ from .config import (
     PROSP_CAMPAIGN_ID,
     MAX_RETRIES,
     RETRY_BACKOFF_BASE,
-    PROSP_WORKERS
+    MAX_RETRY_AFTER,
+    PROSP_WORKERS,
+    PROSP_RETRY_RPS
 )
+from .counters import AtomicCounter
 from .db_logger import PipelineRun, bulk_update_lead_status
+from .json_codec import json_dumps, json_loads
+from .rate_limit import TokenBucket
+
+
+def _create_session(headers: Mapping[str, str]) -> requests.Session:
+    """Create a keep-alive session with a connection pool sized for the Prosp workers."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=PROSP_WORKERS, pool_maxsize=PROSP_WORKERS * 2, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update(headers)
+    return session
+
+
+_INSTANTLY_HEADERS = MappingProxyType({
+    'Authorization': f'Bearer {INSTANTLY_API_KEY}',
+    'Content-Type': 'application/json'
+})
+_PROSP_HEADERS = MappingProxyType({'Content-Type': 'application/json'})
+
+# Shared sessions so every push reuses pooled TCP/TLS connections
+_instantly_session = _create_session(_INSTANTLY_HEADERS)
+_prosp_session = _create_session(_PROSP_HEADERS)
+
+
+def _backoff(attempt: int, multiplier: float = 1, response: requests.Response = None) -> float:
+    """
+    Get the wait time before the next retry.
+
+    Honors a numeric Retry-After header on 429/503 responses (capped at
+    MAX_RETRY_AFTER); otherwise uses exponential backoff with full jitter so
+    parallel workers don't retry in lockstep.
+    """
+    if response is not None and response.status_code in (429, 503):
+        retry_after = response.headers.get('Retry-After')
+        if retry_after:
+            try:
+                seconds = float(retry_after)
+            except ValueError:
+                seconds = None  # HTTP-date format, fall back to jittered backoff
+            if seconds is not None and math.isfinite(seconds) and seconds >= 0:
+                return min(seconds, MAX_RETRY_AFTER)
+
+    return random.uniform(0, (RETRY_BACKOFF_BASE ** (attempt + 1)) * multiplier)
+
+
+class CircuitBreaker:
+    """
+    Fast-fails requests to an endpoint that is rate limiting or erroring.
+
+    CLOSED: requests allowed; outcomes tracked over a sliding window.
+    OPEN: failure rate over the window reached failure_threshold; requests
+          are rejected until cooldown seconds have passed.
+    HALF_OPEN: a single probe request is allowed; success closes the
+               breaker, failure opens it again.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, name: str, window: int = 20, failure_threshold: float = 0.5, cooldown: float = 10.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self._outcomes = deque(maxlen=window)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent right now."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+
+            # HALF_OPEN: only one probe at a time
+            if self._probe_in_flight:
+                return False
+            self._probe_in_flight = True
+            return True
+
+    def cooldown_remaining(self) -> float:
+        """Seconds until an OPEN breaker lets a probe through (0 if not open)."""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def record(self, response: requests.Response = None):
+        """Record a request outcome; None means the request raised."""
+        if response is None or response.status_code == 429 or response.status_code >= 500:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_success(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self._outcomes.clear()
+            self._outcomes.append(True)
+
+    def record_failure(self):
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+
+            self._outcomes.append(False)
+            if len(self._outcomes) == self._outcomes.maxlen:
+                failure_rate = self._outcomes.count(False) / len(self._outcomes)
+                if failure_rate >= self.failure_threshold and self.state == self.CLOSED:
+                    self._open()
+
+    def _open(self):
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._outcomes.clear()
+        print(f'  {self.name} circuit breaker open, pausing requests for {self.cooldown:.0f}s')
+
+
+_instantly_cb = CircuitBreaker('Instantly')
+_prosp_cb = CircuitBreaker('Prosp')
+
+
+class AIMDLimiter:
+    """
+    Adaptive cap on in-flight requests (additive increase, multiplicative decrease).
+
+    Starts at min_limit and adds `increase` after every clean window of
+    outcomes; any 429/5xx or request error multiplies the limit by `decrease`.
+    Converges on the concurrency the provider actually allows.
+    """
+
+    def __init__(
+        self,
+        min_limit: int = 1,
+        max_limit: int = PROSP_WORKERS,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        window: int = 10
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase = increase
+        self.decrease = decrease
+        self.limit = float(min_limit)
+        self._in_flight = 0
+        self._outcomes = deque(maxlen=window)
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """Block until a request slot is free under the current limit."""
+        with self._cond:
+            while self._in_flight >= int(self.limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    def release(self, response: requests.Response = None):
+        """Free a slot and adjust the limit; None means the request raised."""
+        failed = response is None or response.status_code == 429 or response.status_code >= 500
+        with self._cond:
+            self._in_flight -= 1
+            if failed:
+                self.limit = max(self.min_limit, self.limit * self.decrease)
+                self._outcomes.clear()
+            else:
+                self._outcomes.append(True)
+                if len(self._outcomes) == self._outcomes.maxlen:
+                    self.limit = min(self.max_limit, self.limit + self.increase)
+                    self._outcomes.clear()
+            self._cond.notify_all()
 
 
 # Thread-safe counter for Prosp progress
 class ProspProgressCounter:
     def __init__(self):
-        self.uploaded = 0
-        self.failed = 0
-        self.lock = threading.Lock()
+        self._uploaded = AtomicCounter()
+        self._failed = AtomicCounter()
 
     def increment_success(self):
-        with self.lock:
-            self.uploaded += 1
-            return self.uploaded
+        return self._uploaded.increment()
 
     def increment_failure(self):
-        with self.lock:
-            self.failed += 1
-            return self.failed
+        return self._failed.increment()
 
     def get_stats(self):
-        with self.lock:
-            return self.uploaded, self.failed
+        return self._uploaded.value, self._failed.value
+
+
+class StatusUpdateBuffer:
+    """
+    Collects lead IDs from worker threads and writes their status in bulk.
+
+    Flushes once flush_size IDs are pending or flush_interval seconds have
+    passed since the last flush. Updates are best-effort: a crash loses at
+    most one unflushed batch, which the resume logic pushes again next run.
+    """
+
+    def __init__(self, status: str, flush_size: int = 100, flush_interval: float = 2.0):
+        self.status = status
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+
+    def add(self, lead_id: int):
+        self._pending.append(lead_id)
+        if (len(self._pending) >= self.flush_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        with self._lock:
+            lead_ids = []
+            while self._pending:
+                lead_ids.append(self._pending.popleft())
+            self._last_flush = time.monotonic()
+
+        if lead_ids:
+            try:
+                bulk_update_lead_status(lead_ids, self.status)
+            except Exception:
+                pass  # Don't fail the push if DB update fails
 
 
 def validate_leads(leads: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]:
@@ -69,20 +291,19 @@ def validate_leads(leads: List[Dict[str, Any]]) -> Tuple[List[Dict], List[Dict]]
     """
     valid_for_email = []
     valid_for_linkedin = []
+    add_email = valid_for_email.append
+    add_linkedin = valid_for_linkedin.append
 
     for lead in leads:
-        has_company = bool(lead.get('company_name'))
-        has_name = bool(lead.get('person_first_name') or lead.get('person_name'))
-        has_email = bool(lead.get('email'))
-        has_linkedin = bool(lead.get('linkedin_url'))
+        get = lead.get
 
-        # For email campaigns: need company, name, and email
-        if has_company and has_name and has_email:
-            valid_for_email.append(lead)
+        # For email campaigns: need email, company, and name
+        if get('email') and get('company_name') and (get('person_first_name') or get('person_name')):
+            add_email(lead)
 
         # For LinkedIn campaigns: need LinkedIn URL
-        if has_linkedin:
-            valid_for_linkedin.append(lead)
+        if get('linkedin_url'):
+            add_linkedin(lead)
 
     return valid_for_email, valid_for_linkedin
 
@@ -108,11 +329,16 @@ def push_to_campaigns(
     print(f'  Valid for email campaign: {len(valid_for_email)}')
     print(f'  Valid for LinkedIn campaign: {len(valid_for_linkedin)}')
 
-    # Push to Instantly
-    email_results = push_to_instantly(valid_for_email, pipeline_run)
+    try:
+        # Push to Instantly
+        email_results = push_to_instantly(valid_for_email, pipeline_run)
 
-    # Push to Prosp
-    linkedin_results = push_to_prosp(valid_for_linkedin, pipeline_run)
+        # Push to Prosp
+        linkedin_results = push_to_prosp(valid_for_linkedin, pipeline_run)
+    finally:
+        # Release pooled connections (sessions reconnect lazily if reused)
+        _instantly_session.close()
+        _prosp_session.close()
 
     return {
         'email': email_results,
@@ -123,6 +349,116 @@ def push_to_campaigns(
     }
 
 
+def _email_key(lead: Dict[str, Any]) -> str:
+    """Normalized email used to spot duplicate Instantly leads."""
+    return lead['email'].strip().lower()
+
+
+def _linkedin_key(lead: Dict[str, Any]) -> str:
+    """Normalized LinkedIn URL (no scheme, www, query or trailing slash) for Prosp dedup."""
+    parts = urlsplit(lead['linkedin_url'].strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host + parts.path.rstrip('/').lower()
+
+
+def _dedupe_leads(
+    leads: List[Dict[str, Any]],
+    key_func: Callable[[Dict[str, Any]], str]
+) -> Tuple[List[Dict[str, Any]], Dict[int, List[Any]]]:
+    """
+    Drop leads whose key repeats, keeping the first occurrence.
+
+    Returns:
+        Tuple of (unique leads, duplicate db_ids keyed by id() of the kept lead).
+        The duplicate db_ids get the kept lead's status once it is pushed,
+        so resume doesn't pick them up again.
+    """
+    kept = {}
+    duplicate_ids = {}
+    for lead in leads:
+        first = kept.setdefault(key_func(lead), lead)
+        if first is not lead:
+            db_id = lead.get('id') or lead.get('db_id')
+            if db_id:
+                duplicate_ids.setdefault(id(first), []).append(db_id)
+
+    return list(kept.values()), duplicate_ids
+
+
+def _to_instantly_lead(lead: Dict[str, Any], _get=dict.get, _str=str) -> Dict[str, Any]:
+    """Convert a pipeline lead into Instantly's lead format."""
+    first_name = _get(lead, 'person_first_name')
+    if not first_name:
+        # Only split the full name when there is no explicit first name
+        first_name = (_get(lead, 'person_name') or '').split(None, 1)[:1]
+        first_name = first_name[0] if first_name else ''
+
+    return {
+        'email': _get(lead, 'email'),
+        'first_name': first_name,
+        'last_name': _get(lead, 'person_last_name', ''),
+        'company_name': _get(lead, 'company_name'),
+        'website': _get(lead, 'company_website') or f"https://{_get(lead, 'company_domain', '')}",
+        'custom_variables': {
+            'person_title': _get(lead, 'person_title', ''),
+            'hiring_role': _get(lead, 'job_title', ''),
+            'employee_count': _str(_get(lead, 'employee_count', '')),
+            'linkedin_url': _get(lead, 'linkedin_url', ''),
+            'location': _get(lead, 'location', ''),
+        }
+    }
+
+
+def _iter_instantly_batches(
+    leads: List[Dict[str, Any]],
+    batch_size: int,
+    duplicate_ids: Dict[int, List[Any]]
+) -> Iterator[Tuple[List[Dict[str, Any]], List[Any]]]:
+    """
+    Yield (instantly_leads, db_ids) batches, converting leads lazily.
+
+    db_ids holds every lead row a batch covers (including dropped duplicates)
+    for status updates.
+    """
+    batch = []
+    db_ids = []
+    for lead in leads:
+        batch.append(_to_instantly_lead(lead))
+        db_ids.append(lead.get('id') or lead.get('db_id'))
+        db_ids.extend(duplicate_ids.get(id(lead), ()))
+        if len(batch) == batch_size:
+            yield batch, db_ids
+            batch, db_ids = [], []
+
+    if batch:
+        yield batch, db_ids
+
+
+def _prepare_instantly_batch(
+    batches: Iterator[Tuple[List[Dict[str, Any]], List[Any]]]
+) -> Optional[Tuple[List[Dict[str, Any]], List[Any], bytes]]:
+    """
+    Pull the next batch and serialize its request body.
+
+    Returns:
+        Tuple of (batch, db_ids, body), or None when there are no more batches
+    """
+    item = next(batches, None)
+    if item is None:
+        return None
+
+    batch, db_ids = item
+    payload = {
+        'leads': batch,
+        'campaign_id': INSTANTLY_CAMPAIGN_ID,
+        'skip_if_in_workspace': True,  # Don't add duplicates
+    }
+    # Session already sends Content-Type: application/json
+    return batch, db_ids, json_dumps(payload)
+
+
 def push_to_instantly(
     leads: List[Dict[str, Any]],
     pipeline_run: PipelineRun
@@ -149,101 +485,98 @@ def push_to_instantly(
     if skipped_already_pushed > 0:
         print(f'  Skipping {skipped_already_pushed} leads already pushed to Instantly')
 
+    # Drop repeated emails before they go over the wire
+    leads_to_push, duplicate_ids = _dedupe_leads(leads_to_push, _email_key)
+    duplicate_count = sum(len(ids) for ids in duplicate_ids.values())
+    if duplicate_count > 0:
+        print(f'  Dropped {duplicate_count} duplicate leads (same email)')
+
     stage_id = pipeline_run.start_stage('push_email', input_count=len(leads_to_push))
 
     if not leads_to_push:
         pipeline_run.complete_stage(stage_id, output_count=0)
         return {'uploaded': 0, 'failed': 0, 'skipped_already_pushed': skipped_already_pushed}
 
-    headers = {
-        'Authorization': f'Bearer {INSTANTLY_API_KEY}',
-        'Content-Type': 'application/json'
-    }
-
-    # Prepare lead data for Instantly, keeping track of db_ids for status updates
-    instantly_leads = []
-    lead_db_ids = []  # Track db_ids in same order as instantly_leads
-    for lead in leads_to_push:
-        instantly_lead = {
-            'email': lead.get('email'),
-            'first_name': lead.get('person_first_name') or lead.get('person_name', '').split()[0],
-            'last_name': lead.get('person_last_name', ''),
-            'company_name': lead.get('company_name'),
-            'website': lead.get('company_website') or f"https://{lead.get('company_domain', '')}",
-            'custom_variables': {
-                'person_title': lead.get('person_title', ''),
-                'hiring_role': lead.get('job_title', ''),
-                'employee_count': str(lead.get('employee_count', '')),
-                'linkedin_url': lead.get('linkedin_url', ''),
-                'location': lead.get('location', ''),
-            }
-        }
-        instantly_leads.append(instantly_lead)
-        # Use 'id' for leads from DB, 'db_id' for leads from current run
-        lead_db_ids.append(lead.get('id') or lead.get('db_id'))
-
     # Instantly accepts up to 1000 leads per request
     batch_size = 1000
-    batches = [instantly_leads[i:i + batch_size] for i in range(0, len(instantly_leads), batch_size)]
-    batch_db_ids = [lead_db_ids[i:i + batch_size] for i in range(0, len(lead_db_ids), batch_size)]
+    batch_count = (len(leads_to_push) + batch_size - 1) // batch_size
 
     total_uploaded = 0
     total_failed = 0
     errors = []
 
-    print(f'Pushing {len(instantly_leads)} leads to Instantly in {len(batches)} batch(es)...')
-
-    for batch_num, (batch, db_ids) in enumerate(zip(batches, batch_db_ids), 1):
-        payload = {
-            'leads': batch,
-            'campaign_id': INSTANTLY_CAMPAIGN_ID,
-            'skip_if_in_workspace': True,  # Don't add duplicates
-        }
-
-        batch_success = False
-        for attempt in range(MAX_RETRIES):
-            try:
-                response = requests.post(
-                    f'{INSTANTLY_API_URL}/leads/add',
-                    headers=headers,
-                    json=payload,
-                    timeout=120
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    uploaded = result.get('leads_uploaded', 0)
-                    total_uploaded += uploaded
-                    skipped = result.get('skipped_count', 0) + result.get('duplicated_leads', 0)
-
-                    print(f'  Batch {batch_num}: {uploaded} uploaded, {skipped} skipped')
-                    batch_success = True
-                    break
-                else:
+    print(f'Pushing {len(leads_to_push)} leads to Instantly in {batch_count} batch(es)...')
+
+    batches = _iter_instantly_batches(leads_to_push, batch_size, duplicate_ids)
+
+    # Prepare (convert + serialize) the next batch while the current one is in flight.
+    # Only one Instantly request is ever outstanding.
+    with ThreadPoolExecutor(max_workers=1) as prep_executor:
+        next_batch = prep_executor.submit(_prepare_instantly_batch, batches)
+        batch_num = 0
+
+        while True:
+            prepared = next_batch.result()
+            if prepared is None:
+                break
+            batch_num += 1
+            batch, db_ids, body = prepared
+            next_batch = prep_executor.submit(_prepare_instantly_batch, batches)
+
+            batch_success = False
+            for attempt in range(MAX_RETRIES):
+                if not _instantly_cb.allow():
+                    # Only one request is ever in flight: wait out the cooldown and
+                    # send this batch as the half-open probe instead of dropping it
+                    wait_time = _instantly_cb.cooldown_remaining()
+                    print(f'    Instantly circuit breaker open, waiting {wait_time:.1f}s before probing...')
+                    time.sleep(wait_time)
+                    if not _instantly_cb.allow():
+                        error_type, error_msg = 'CIRCUIT_OPEN', 'Instantly circuit breaker open, batch not sent'
+                        continue
+
+                response = None
+                try:
+                    response = _instantly_session.post(
+                        f'{INSTANTLY_API_URL}/leads/add',
+                        data=body,
+                        timeout=120
+                    )
+
+                    if response.status_code == 200:
+                        _instantly_cb.record(response)
+                        result = json_loads(response.content)
+                        uploaded = result.get('leads_uploaded', 0)
+                        total_uploaded += uploaded
+                        skipped = result.get('skipped_count', 0) + result.get('duplicated_leads', 0)
+
+                        print(f'  Batch {batch_num}: {uploaded} uploaded, {skipped} skipped')
+                        batch_success = True
+                        break
+
+                    error_type = 'API_ERROR'
                     error_msg = f'Instantly API error: {response.status_code} - {response.text}'
-                    if attempt < MAX_RETRIES - 1:
-                        wait_time = RETRY_BACKOFF_BASE ** (attempt + 1)
-                        print(f'    {error_msg}, retrying in {wait_time}s...')
-                        time.sleep(wait_time)
-                    else:
-                        errors.append({'batch': batch_num, 'error': error_msg})
-                        total_failed += len(batch)
-                        pipeline_run.log_error('push_email', 'API_ERROR', error_msg)
+                    _instantly_cb.record(response)
+
+                except Exception as e:
+                    error_type, error_msg = 'REQUEST_ERROR', str(e)
+                    _instantly_cb.record(response)
 
-            except Exception as e:
                 if attempt < MAX_RETRIES - 1:
-                    wait_time = RETRY_BACKOFF_BASE ** (attempt + 1)
+                    wait_time = _backoff(attempt, response=response)
+                    print(f'    {error_msg}, retrying in {wait_time:.1f}s...')
                     time.sleep(wait_time)
-                else:
-                    errors.append({'batch': batch_num, 'error': str(e)})
-                    total_failed += len(batch)
-                    pipeline_run.log_error('push_email', 'REQUEST_ERROR', str(e))
 
-        # IMMEDIATE STATUS UPDATE: Mark leads as pushed after successful batch
-        if batch_success:
-            valid_db_ids = [db_id for db_id in db_ids if db_id is not None]
-            if valid_db_ids:
-                bulk_update_lead_status(valid_db_ids, 'pushed_instantly')
+            if not batch_success:
+                errors.append({'batch': batch_num, 'error': error_msg})
+                total_failed += len(batch)
+                pipeline_run.log_error('push_email', error_type, error_msg)
+
+            # IMMEDIATE STATUS UPDATE: Mark leads as pushed after successful batch
+            if batch_success:
+                valid_db_ids = [db_id for db_id in db_ids if db_id is not None]
+                if valid_db_ids:
+                    bulk_update_lead_status(valid_db_ids, 'pushed_instantly')
 
     print(f'Instantly push complete: {total_uploaded} uploaded, {total_failed} failed')
 
@@ -270,7 +603,7 @@ def push_to_prosp(
     Push leads to Prosp LinkedIn campaign using parallel processing.
 
     Features:
-    - Immediate status update: Each successful push updates DB right away
+    - Batched status update: Successful pushes are flushed to the DB in bulk
     - Resume capability: Skips leads already pushed (status='pushed_prosp')
     - Retry queue: Failed leads are retried at the end with longer delays
 
@@ -288,6 +621,12 @@ def push_to_prosp(
     if skipped_already_pushed > 0:
         print(f'  Skipping {skipped_already_pushed} leads already pushed to Prosp')
 
+    # Drop repeated LinkedIn profiles (trailing slash, www and query variants)
+    leads_to_push, duplicate_ids = _dedupe_leads(leads_to_push, _linkedin_key)
+    duplicate_count = sum(len(ids) for ids in duplicate_ids.values())
+    if duplicate_count > 0:
+        print(f'  Dropped {duplicate_count} duplicate leads (same LinkedIn profile)')
+
     stage_id = pipeline_run.start_stage('push_linkedin', input_count=len(leads_to_push))
 
     if not leads_to_push:
@@ -299,12 +638,17 @@ def push_to_prosp(
     errors_lock = threading.Lock()
     failed_leads = []  # Collect failed leads for retry
     failed_leads_lock = threading.Lock()
+    status_buffer = StatusUpdateBuffer('pushed_prosp')
+    # PROSP_WORKERS threads, but only as many in-flight requests as Prosp tolerates
+    concurrency = AIMDLimiter(max_limit=PROSP_WORKERS)
+    # Paces the sequential retry pass; slows down when Prosp answers 429
+    retry_bucket = TokenBucket(rate=PROSP_RETRY_RPS)
 
     print(f'Pushing {len(leads_to_push)} leads to Prosp using {PROSP_WORKERS} workers...')
 
     def push_single_lead(lead: Dict[str, Any], index: int, is_retry: bool = False) -> bool:
-        """Push a single lead to Prosp (runs in thread pool)."""
-        # Get db_id - could be 'id' (from DB) or 'db_id' (from current run)
+        """Push a single lead to Prosp (runs in worker threads)."""
+        # 'id' for leads loaded from the DB, 'db_id' for leads from the current run
         db_id = lead.get('id') or lead.get('db_id')
 
         payload = {
@@ -322,102 +666,135 @@ def push_to_prosp(
                 {'property': 'company_website', 'value': lead.get('company_website', '')},
             ]
         }
+        # Serialize once; every retry reuses the same body
+        body = json_dumps(payload)
 
         # Use more retries for retry pass
         max_attempts = MAX_RETRIES * 2 if is_retry else MAX_RETRIES
         backoff_multiplier = 2 if is_retry else 1
 
+        error_msg = None
         for attempt in range(max_attempts):
+            if not _prosp_cb.allow():
+                error_msg = 'Prosp circuit breaker open'
+                if not is_retry:
+                    # First pass: go straight to the retry queue instead of burning retries
+                    break
+                # Retry pass (sequential): wait out the cooldown, then send the
+                # half-open probe as this attempt
+                time.sleep(_prosp_cb.cooldown_remaining())
+                if not _prosp_cb.allow():
+                    continue
+
+            response = None
+            concurrency.acquire()
             try:
-                response = requests.post(
+                response = _prosp_session.post(
                     f'{PROSP_API_URL}/leads',
-                    headers={'Content-Type': 'application/json'},
-                    json=payload,
+                    data=body,
                     timeout=30
                 )
+            except Exception as e:
+                error_msg = str(e)
+            finally:
+                concurrency.release(response)
+                _prosp_cb.record(response)
+
+            if response is not None:
+                if is_retry:
+                    if response.status_code == 429:
+                        retry_bucket.throttle()
+                    elif response.status_code in [200, 201]:
+                        retry_bucket.relax()
 
                 if response.status_code in [200, 201]:
-                    # IMMEDIATE STATUS UPDATE: Mark as pushed right after success
+                    # Queue status update; flushed to the DB in batches
                     if db_id:
-                        try:
-                            pipeline_run.update_lead(db_id, {'status': 'pushed_prosp'})
-                        except Exception:
-                            pass  # Don't fail the push if DB update fails
+                        status_buffer.add(db_id)
+                    for duplicate_id in duplicate_ids.get(id(lead), ()):
+                        status_buffer.add(duplicate_id)
 
                     count = progress.increment_success()
                     if count % 50 == 0:
                         print(f'  Uploaded {count}/{len(leads_to_push)} leads to Prosp')
                     return True
-                else:
-                    if attempt < max_attempts - 1:
-                        wait_time = (RETRY_BACKOFF_BASE ** (attempt + 1)) * backoff_multiplier
-                        time.sleep(wait_time)
-                    else:
-                        # Final attempt failed
-                        if not is_retry:
-                            # Add to retry queue for later
-                            with failed_leads_lock:
-                                failed_leads.append(lead)
-                        else:
-                            # Already in retry pass, log error
-                            with errors_lock:
-                                errors.append({
-                                    'lead_index': index,
-                                    'linkedin_url': lead.get('linkedin_url'),
-                                    'db_id': db_id,
-                                    'error': f'Prosp API error: {response.status_code}'
-                                })
-                        progress.increment_failure()
-                        return False
-
-            except Exception as e:
-                if attempt < max_attempts - 1:
-                    wait_time = (RETRY_BACKOFF_BASE ** (attempt + 1)) * backoff_multiplier
-                    time.sleep(wait_time)
-                else:
-                    if not is_retry:
-                        with failed_leads_lock:
-                            failed_leads.append(lead)
-                    else:
-                        with errors_lock:
-                            errors.append({
-                                'lead_index': index,
-                                'linkedin_url': lead.get('linkedin_url'),
-                                'db_id': db_id,
-                                'error': str(e)
-                            })
-                    progress.increment_failure()
-                    return False
 
+                error_msg = f'Prosp API error: {response.status_code}'
+
+            if attempt < max_attempts - 1:
+                wait_time = _backoff(attempt, backoff_multiplier, response)
+                time.sleep(wait_time)
+
+        # All attempts failed
+        if not is_retry:
+            # Add to retry queue for later
+            with failed_leads_lock:
+                failed_leads.append(lead)
+        else:
+            # Already in retry pass, log error
+            with errors_lock:
+                errors.append({
+                    'lead_index': index,
+                    'linkedin_url': lead.get('linkedin_url'),
+                    'db_id': db_id,
+                    'error': error_msg
+                })
+        progress.increment_failure()
         return False
 
-    # Process leads in parallel
-    with ThreadPoolExecutor(max_workers=PROSP_WORKERS) as executor:
-        futures = {executor.submit(push_single_lead, lead, i): lead for i, lead in enumerate(leads_to_push)}
+    try:
+        # Process leads in parallel: a bounded queue feeds the worker threads,
+        # so memory stays constant regardless of lead count
+        lead_queue = queue.Queue(maxsize=PROSP_WORKERS * 2)
 
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception:
-                pass  # Errors already tracked in push_single_lead
-
-    # RETRY PASS: Try failed leads again with longer delays
-    if failed_leads:
-        print(f'\n  Retrying {len(failed_leads)} failed leads with longer delays...')
-        # Reset failure counter for retry pass
-        retry_progress = ProspProgressCounter()
-
-        # Process retries sequentially with longer delays to avoid rate limiting
-        for i, lead in enumerate(failed_leads):
-            time.sleep(1)  # 1 second delay between retries
-            success = push_single_lead(lead, i, is_retry=True)
-            if success:
-                retry_progress.increment_success()
-            else:
-                retry_progress.increment_failure()
+        def worker():
+            while True:
+                item = lead_queue.get()
+                if item is None:
+                    break
+                index, lead = item
+                try:
+                    push_single_lead(lead, index)
+                except Exception:
+                    pass  # Errors already tracked in push_single_lead
+
+        workers = [threading.Thread(target=worker, daemon=True) for _ in range(PROSP_WORKERS)]
+        for thread in workers:
+            thread.start()
+
+        for i, lead in enumerate(leads_to_push):
+            lead_queue.put((i, lead))
+        for _ in workers:
+            lead_queue.put(None)  # One shutdown sentinel per worker
+
+        for thread in workers:
+            thread.join()
+
+        # RETRY PASS: Try failed leads again with longer delays
+        if failed_leads:
+            print(f'\n  Retrying {len(failed_leads)} failed leads with longer delays...')
+            # Reset failure counter for retry pass
+            retry_progress = ProspProgressCounter()
+
+            # Process retries sequentially, rate-limited by retry_bucket.
+            # If the breaker is open, wait out its cooldown so the next request is
+            # a single half-open probe rather than a burst.
+            for i, lead in enumerate(failed_leads):
+                cooldown = _prosp_cb.cooldown_remaining()
+                if cooldown > 0:
+                    time.sleep(cooldown)
+                retry_bucket.acquire()
+                success = push_single_lead(lead, i, is_retry=True)
+                if success:
+                    retry_progress.increment_success()
+                else:
+                    retry_progress.increment_failure()
 
-        retry_success, retry_failed = retry_progress.get_stats()
-        print(f'  Retry complete: {retry_success} recovered, {retry_failed} permanently failed')
+            retry_success, retry_failed = retry_progress.get_stats()
+            print(f'  Retry complete: {retry_success} recovered, {retry_failed} permanently failed')
+    finally:
+        # Write any remaining status updates
+        status_buffer.flush()
 
     total_uploaded, total_failed = progress.get_stats()
     print(f'Prosp push complete: {total_uploaded} uploaded, {total_failed} failed')
@@ -454,13 +831,13 @@ def update_lead_statuses(
     valid_for_email, valid_for_linkedin = validate_leads(leads)
 
     # Update status for leads pushed to email
-    for lead in valid_for_email:
-        if lead.get('db_id'):
-            pipeline_run.update_lead(lead['db_id'], {'status': 'pushed_email'})
-
-    # Update status for leads pushed to LinkedIn
-    for lead in valid_for_linkedin:
-        if lead.get('db_id'):
-            current_status = 'pushed_email' if lead in valid_for_email else 'validated'
-            new_status = 'pushed_linkedin' if current_status == 'pushed_email' else 'pushed_linkedin'
-            pipeline_run.update_lead(lead['db_id'], {'status': new_status})
+    bulk_update_lead_status(
+        [lead['db_id'] for lead in valid_for_email if lead.get('db_id')],
+        'pushed_email'
+    )
+
+    # Update status for leads pushed to LinkedIn (takes precedence over email)
+    bulk_update_lead_status(
+        [lead['db_id'] for lead in valid_for_linkedin if lead.get('db_id')],
+        'pushed_linkedin'
+    )
@@ -3,10 +3,13 @@
 Check the latest Apify runs to debug why we're not seeing the newest run.
 """
 
+import json
 import sys
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import os
+from typing import TYPE_CHECKING
 
 # Add parent directory to path for imports
 script_dir = Path(__file__).parent
@@ -19,10 +22,46 @@ try:
 except ImportError:
     pass
 
-from apify_client import ApifyClient
+if TYPE_CHECKING:
+    from apify_client import ApifyClient
 
 APIFY_API_KEY = os.getenv('APIFY_API_KEY', '')
 LINKEDIN_SCRAPER_ACTOR = 'curious_coder/linkedin-jobs-scraper'
+DATASET_FETCH_WORKERS = 20
+
+# Dataset metadata of SUCCEEDED runs never changes, so it is cached by run ID
+CACHE_PATH = script_dir.parent.parent / 'data' / 'apify_runs.cache.json'
+
+
+def load_cache() -> dict:
+    """Load the run metadata cache (empty if missing or unreadable)."""
+    try:
+        with open(CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache: dict):
+    """Write the run metadata cache."""
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_PATH, 'w') as f:
+        json.dump(cache, f)
+
+
+def fetch_dataset_infos(client: 'ApifyClient', dataset_ids: list) -> dict:
+    """Fetch dataset metadata for several datasets concurrently (None on error)."""
+    def fetch(dataset_id):
+        try:
+            return client.dataset(dataset_id).get()
+        except Exception:
+            return None
+
+    if not dataset_ids:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(DATASET_FETCH_WORKERS, len(dataset_ids))) as executor:
+        return dict(zip(dataset_ids, executor.map(fetch, dataset_ids)))
 
 
 def check_runs():
@@ -31,6 +70,9 @@ def check_runs():
     print('CHECKING LATEST APIFY RUNS')
     print('=' * 60)
 
+    # Imported here so importing this module's helpers doesn't load the SDK
+    from apify_client import ApifyClient
+
     # Initialize client
     client = ApifyClient(APIFY_API_KEY)
 
@@ -50,6 +92,32 @@ def check_runs():
 
     print(f'Found {len(runs_list.items)} recent runs:\n')
 
+    # Dataset info for successful runs: from the cache, else fetched in parallel
+    cache = load_cache()
+    dataset_infos = {}
+    to_fetch = {}  # dataset_id -> run_id
+    for run in runs_list.items:
+        dataset_id = run.get('defaultDatasetId')
+        if run.get('status') != 'SUCCEEDED' or not dataset_id:
+            continue
+        cached = cache.get(run.get('id'))
+        if cached is not None:
+            dataset_infos[dataset_id] = cached
+        else:
+            to_fetch[dataset_id] = run.get('id')
+
+    if to_fetch:
+        for dataset_id, dataset_info in fetch_dataset_infos(client, list(to_fetch)).items():
+            if dataset_info:
+                dataset_infos[dataset_id] = cache[to_fetch[dataset_id]] = {
+                    'itemCount': dataset_info.get('itemCount'),
+                }
+        save_cache(cache)
+
+    # Latest SUCCEEDED run, tracked while rendering the table
+    latest_run = None
+    latest_started = ''
+
     for i, run in enumerate(runs_list.items):
         status = run.get('status', 'UNKNOWN')
         run_id = run.get('id', 'N/A')
@@ -73,22 +141,19 @@ def check_runs():
         print(f'    Dataset:  {dataset_id}')
 
         # Get dataset info if available
-        if status == 'SUCCEEDED' and dataset_id != 'N/A':
-            try:
-                dataset_info = client.dataset(dataset_id).get()
-                if dataset_info:
-                    item_count = dataset_info.get('itemCount', 'unknown')
-                    print(f'    Items:    {item_count}')
-            except:
-                pass
+        dataset_info = dataset_infos.get(dataset_id)
+        if status == 'SUCCEEDED' and dataset_info:
+            item_count = dataset_info.get('itemCount', 'unknown')
+            print(f'    Items:    {item_count}')
 
-        print()
+        if status == 'SUCCEEDED':
+            run_started = run.get('startedAt', '')
+            if latest_run is None or run_started > latest_started:
+                latest_run, latest_started = run, run_started
 
-    # Find latest SUCCEEDED run
-    succeeded_runs = [run for run in runs_list.items if run.get('status') == 'SUCCEEDED']
+        print()
 
-    if succeeded_runs:
-        latest_run = max(succeeded_runs, key=lambda r: r.get('startedAt', ''))
+    if latest_run:
         print('=' * 60)
         print('LATEST SUCCESSFUL RUN:')
         print('=' * 60)
@@ -98,7 +163,9 @@ def check_runs():
 
         dataset_id = latest_run.get('defaultDatasetId')
         if dataset_id:
-            dataset_info = client.dataset(dataset_id).get()
+            dataset_info = dataset_infos.get(dataset_id)
+            if dataset_info is None:
+                dataset_info = client.dataset(dataset_id).get()
             if dataset_info:
                 print(f'Items: {dataset_info.get("itemCount")}')
 
@@ -3,12 +3,82 @@ Company Filter module.
 Filters job postings by country, employee count, and deduplicates by company.
 """
 
-from typing import List, Dict, Any, Set
+import re
+from operator import itemgetter
+from typing import List, Dict, Any, Set, Tuple
 from .config import MIN_EMPLOYEES, MAX_EMPLOYEES, ALLOWED_COUNTRIES
 from .db_logger import PipelineRun
 from .linkedin_scraper import extract_job_data
 
 
+SOFTWARE_KEYWORDS = (
+    'software', 'technology', 'tech', 'saas', 'cloud', 'ai', 'ml',
+    'machine learning', 'artificial intelligence', 'data', 'analytics',
+    'platform', 'digital', 'internet', 'web', 'app', 'mobile',
+    'automation', 'devops', 'engineering', 'developer', 'startup',
+    'fintech', 'healthtech', 'edtech', 'proptech', 'insurtech',
+    'cybersecurity', 'security', 'blockchain', 'crypto', 'api',
+)
+
+# Matching is substring-based, so a keyword containing another keyword
+# ('fintech' > 'tech', 'cybersecurity' > 'security') can never change the
+# result. Drop those and match the rest in one alternation against
+# lowercased text (cheaper than re.IGNORECASE).
+_SOFTWARE_MATCH_KEYWORDS = tuple(
+    k for k in SOFTWARE_KEYWORDS
+    if not any(other != k and other in k for other in SOFTWARE_KEYWORDS)
+)
+SOFTWARE_RE = re.compile('|'.join(re.escape(k) for k in _SOFTWARE_MATCH_KEYWORDS))
+
+
+# Rejection reasons, in check order (keys of the logged rejection_stats)
+REJECTION_REASONS = (
+    'no_country',
+    'wrong_country',
+    'no_employee_count',
+    'too_few_employees',
+    'too_many_employees',
+    'no_domain',
+    'duplicate',
+)
+(
+    _REJ_NO_COUNTRY,
+    _REJ_WRONG_COUNTRY,
+    _REJ_NO_EMPLOYEE_COUNT,
+    _REJ_TOO_FEW_EMPLOYEES,
+    _REJ_TOO_MANY_EMPLOYEES,
+    _REJ_NO_DOMAIN,
+    _REJ_DUPLICATE,
+) = range(len(REJECTION_REASONS))
+
+_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+
+
+def _canon_domain(domain: str) -> str:
+    """Normalize a domain for dedup: case, scheme, 'www.' and slashes."""
+    domain = _SCHEME_RE.sub('', domain.strip()).casefold()
+    return domain.removeprefix('www.').strip('/')
+
+
+def _is_software(company: Dict[str, Any]) -> bool:
+    """Keyword check for software/tech companies (see filter_software_companies)."""
+    # One lowercase pass over all three fields. The \x1f separators keep
+    # multi-word keywords from matching across fields; job_title comes first
+    # so its span can be searched on its own.
+    text = '\x1f'.join((
+        company.get('job_title') or '',
+        company.get('industries') or '',
+        company.get('company_description') or '',
+    )).lower()
+    title_end = text.index('\x1f')
+
+    # Software engineer jobs almost always indicate a software company
+    if text.find('software', 0, title_end) >= 0 or text.find('engineer', 0, title_end) >= 0:
+        return True
+
+    return SOFTWARE_RE.search(text, title_end + 1) is not None
+
+
 def filter_companies(
     jobs: List[Dict[str, Any]],
     pipeline_run: PipelineRun
@@ -28,60 +98,91 @@ def filter_companies(
     Returns:
         List of unique, filtered company dictionaries
     """
+    filtered_companies, _ = filter_and_classify(jobs, pipeline_run)
+    return filtered_companies
+
+
+def filter_and_classify(
+    jobs: List[Dict[str, Any]],
+    pipeline_run: PipelineRun
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Filter, deduplicate and software-classify companies in a single pass.
+
+    Applies the same filters as filter_companies, then runs the
+    filter_software_companies keyword check on each accepted company.
+
+    Args:
+        jobs: Raw job postings from scraper
+        pipeline_run: PipelineRun instance for logging
+
+    Returns:
+        Tuple of (filtered companies, software companies among them)
+    """
     stage_id = pipeline_run.start_stage('filter', input_count=len(jobs))
 
     filtered_companies = []
+    software_companies = []
     seen_domains: Set[str] = set()
-    rejection_stats = {
-        'no_country': 0,
-        'wrong_country': 0,
-        'no_employee_count': 0,
-        'too_few_employees': 0,
-        'too_many_employees': 0,
-        'no_domain': 0,
-        'duplicate': 0,
-    }
+    # Counted by index in the loop; turned back into a dict for logging
+    rejections = [0] * len(REJECTION_REASONS)
+
+    # Bind globals/methods to locals for the per-row loop
+    allowed_countries = ALLOWED_COUNTRIES
+    min_employees, max_employees = MIN_EMPLOYEES, MAX_EMPLOYEES
+    canon_domain, is_software = _canon_domain, _is_software
+    add_domain = seen_domains.add
+    add_filtered = filtered_companies.append
+    add_software = software_companies.append
 
     for job in jobs:
-        extracted = extract_job_data(job)
+        # Parse each raw job once; re-filtering the same jobs reuses the result
+        extracted = job.get('_extracted')
+        if extracted is None:
+            extracted = job['_extracted'] = extract_job_data(job)
 
         # Check country
         country = extracted.get('country')
         if not country:
-            rejection_stats['no_country'] += 1
+            rejections[_REJ_NO_COUNTRY] += 1
             continue
 
-        if country not in ALLOWED_COUNTRIES:
-            rejection_stats['wrong_country'] += 1
+        if country not in allowed_countries:
+            rejections[_REJ_WRONG_COUNTRY] += 1
             continue
 
         # Check employee count
         employee_count = extracted.get('employee_count')
         if employee_count is None:
-            rejection_stats['no_employee_count'] += 1
+            rejections[_REJ_NO_EMPLOYEE_COUNT] += 1
             continue
 
-        if employee_count < MIN_EMPLOYEES:
-            rejection_stats['too_few_employees'] += 1
+        if employee_count < min_employees:
+            rejections[_REJ_TOO_FEW_EMPLOYEES] += 1
             continue
 
-        if employee_count > MAX_EMPLOYEES:
-            rejection_stats['too_many_employees'] += 1
+        if employee_count > max_employees:
+            rejections[_REJ_TOO_MANY_EMPLOYEES] += 1
             continue
 
         # Check domain for deduplication
-        domain = extracted.get('company_domain')
+        domain = canon_domain(extracted.get('company_domain') or '')
         if not domain:
-            rejection_stats['no_domain'] += 1
+            rejections[_REJ_NO_DOMAIN] += 1
             continue
 
         if domain in seen_domains:
-            rejection_stats['duplicate'] += 1
+            rejections[_REJ_DUPLICATE] += 1
             continue
 
         # Company passes all filters
-        seen_domains.add(domain)
-        filtered_companies.append(extracted)
+        add_domain(domain)
+        extracted['company_domain'] = domain
+        add_filtered(extracted)
+        if is_software(extracted):
+            add_software(extracted)
+
+    rejection_stats = dict(zip(REJECTION_REASONS, rejections))
 
     # Log filtering results
     print(f'Filtering complete:')
@@ -101,7 +202,9 @@ def filter_companies(
         error_details=error_details
     )
 
-    return filtered_companies
+    print(f'Software filter: {len(filtered_companies)} -> {len(software_companies)} companies')
+
+    return filtered_companies, software_companies
 
 
 def filter_software_companies(
@@ -121,64 +224,41 @@ def filter_software_companies(
     Returns:
         Filtered list of software companies
     """
-    SOFTWARE_KEYWORDS = [
-        'software', 'technology', 'tech', 'saas', 'cloud', 'ai', 'ml',
-        'machine learning', 'artificial intelligence', 'data', 'analytics',
-        'platform', 'digital', 'internet', 'web', 'app', 'mobile',
-        'automation', 'devops', 'engineering', 'developer', 'startup',
-        'fintech', 'healthtech', 'edtech', 'proptech', 'insurtech',
-        'cybersecurity', 'security', 'blockchain', 'crypto', 'api',
-    ]
-
-    filtered = []
-
-    for company in companies:
-        # Check industries field
-        industries = (company.get('industries') or '').lower()
-        description = (company.get('company_description') or '').lower()
-        job_title = (company.get('job_title') or '').lower()
-
-        # Software engineer jobs almost always indicate a software company
-        if 'software' in job_title or 'engineer' in job_title:
-            filtered.append(company)
-            continue
-
-        # Check for software keywords in industries or description
-        is_software = any(
-            keyword in industries or keyword in description
-            for keyword in SOFTWARE_KEYWORDS
-        )
-
-        if is_software:
-            filtered.append(company)
+    filtered = [company for company in companies if _is_software(company)]
 
     print(f'Software filter: {len(companies)} -> {len(filtered)} companies')
 
     return filtered
 
 
+# Fields handed to the decision maker search stage
+SEARCH_FIELDS = (
+    'company_name',
+    'company_domain',
+    'company_website',
+    'job_title',  # The role they're hiring for
+    'employee_count',
+    'location',
+    'country',
+    'state',
+    'city',
+)
+_get_search_fields = itemgetter(*SEARCH_FIELDS)
+
+
 def prepare_for_search(companies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Prepare company data for the decision maker search stage.
 
     Args:
-        companies: Filtered company list
+        companies: Filtered company list (extract_job_data output, so every
+            SEARCH_FIELDS key is present)
 
     Returns:
         List of companies with essential fields for searching
     """
     return [
-        {
-            'company_name': c.get('company_name'),
-            'company_domain': c.get('company_domain'),
-            'company_website': c.get('company_website'),
-            'job_title': c.get('job_title'),  # The role they're hiring for
-            'employee_count': c.get('employee_count'),
-            'location': c.get('location'),
-            'country': c.get('country'),
-            'state': c.get('state'),
-            'city': c.get('city'),
-        }
+        dict(zip(SEARCH_FIELDS, _get_search_fields(c)))
         for c in companies
         if c.get('company_domain')  # Ensure we have a domain to search
     ]
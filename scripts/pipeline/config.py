@@ -44,22 +44,28 @@ LINKEDIN_JOB_URL = (
     'f_C=B%2CC%2CD&'  # Company size: 11-50, 51-200, 201-500 employees
     'origin=JOB_SEARCH_PAGE_KEYWORD_AUTOCOMPLETE&refresh=true'
 )
-DEFAULT_JOB_COUNT = 1000  # Balanced for 3-hour GitHub Actions limit
+DEFAULT_JOB_COUNT = int(os.getenv('DEFAULT_JOB_COUNT', '1000'))  # Balanced for 3-hour GitHub Actions limit
 TEST_JOB_COUNT = 100
 
 # Pipeline Caps (prevent runaway execution time)
-MAX_COMPANIES_PER_RUN = 200  # Max companies to search in Stage 3
-MAX_LEADS_PER_RUN = 500  # Max leads to enrich in Stage 4
+MAX_COMPANIES_PER_RUN = int(os.getenv('MAX_COMPANIES_PER_RUN', '200'))  # Max companies to search in Stage 3
+MAX_LEADS_PER_RUN = int(os.getenv('MAX_LEADS_PER_RUN', '500'))  # Max leads to enrich in Stage 4
 
 # Company Filter Configuration
-MIN_EMPLOYEES = 11
-MAX_EMPLOYEES = 500  # Expanded from 200 to capture more mid-market companies
-ALLOWED_COUNTRIES = ['US', 'CA', 'GB', 'AU']  # Added Canada, UK, Australia
+MIN_EMPLOYEES = int(os.getenv('MIN_EMPLOYEES', '11'))
+MAX_EMPLOYEES = int(os.getenv('MAX_EMPLOYEES', '500'))  # Expanded from 200 to capture more mid-market companies
+# Added Canada, UK, Australia
+_DEFAULT_ALLOWED_COUNTRIES = 'US,CA,GB,AU'
+# An empty or blank value would reject every company, so it falls back to the default
+ALLOWED_COUNTRIES = frozenset(
+    c.strip().upper() for c in os.getenv('ALLOWED_COUNTRIES', _DEFAULT_ALLOWED_COUNTRIES).split(',') if c.strip()
+) or frozenset(_DEFAULT_ALLOWED_COUNTRIES.split(','))
 
 # Exa AI Configuration
-EXA_SEARCH_LIMIT = 25  # Increased from 10 for more results per company
-EXA_API_DELAY = 0.1  # Minimal delay - rate limiting handled by parallel workers
-EXA_WORKERS = 10  # Number of parallel workers for Exa search
+EXA_SEARCH_LIMIT = int(os.getenv('EXA_SEARCH_LIMIT', '25'))  # Increased from 10 for more results per company
+EXA_API_DELAY = float(os.getenv('EXA_API_DELAY', '0.1'))  # Minimum spacing between Exa calls across all workers (shared rate limiter)
+EXA_WORKERS = int(os.getenv('EXA_WORKERS', '10'))  # Number of parallel workers for Exa search
+EXA_CACHE_TTL_HOURS = float(os.getenv('EXA_CACHE_TTL_HOURS', '168'))  # Reuse cached Exa results for a week (0 disables)
 
 # LLM Validation Configuration
 OPENROUTER_BASE_URL = 'https://openrouter.ai/api/v1'
@@ -69,24 +75,29 @@ LLM_VALIDATION_ENABLED = False  # Disabled by default - adds significant overhea
 # Icypeas Configuration
 ICYPEAS_BASE_URL = 'https://app.icypeas.com/api'
 ICYPEAS_BATCH_SIZE = 5000  # Max items per bulk request
-ICYPEAS_POLL_INTERVAL = 5  # Seconds between status checks
-ICYPEAS_POLL_TIMEOUT = 1800  # Max seconds to wait for results (30 minutes for bulk searches with many items)
+ICYPEAS_POLL_INTERVAL = float(os.getenv('ICYPEAS_POLL_INTERVAL', '5'))  # Seconds between status checks
+ICYPEAS_POLL_TIMEOUT = int(os.getenv('ICYPEAS_POLL_TIMEOUT', '1800'))  # Max seconds to wait for results (30 minutes for bulk searches with many items)
+ICYPEAS_POLL_MAX_INTERVAL = float(os.getenv('ICYPEAS_POLL_MAX_INTERVAL', '60'))  # Longest wait between bulk status checks (lower it for quicker pickup)
+ICYPEAS_MAX_CONCURRENT_BATCHES = int(os.getenv('ICYPEAS_MAX_CONCURRENT_BATCHES', '3'))  # Bulk search batches submitted and polled at once
+EMAIL_CACHE_TTL_HOURS = float(os.getenv('EMAIL_CACHE_TTL_HOURS', '168'))  # Reuse found emails for a week (0 disables)
 
 # Campaign API URLs
 INSTANTLY_API_URL = 'https://api.instantly.ai/api/v2'
 PROSP_API_URL = 'https://prosp.ai/api/v1'
 
 # Rate Limiting
-API_DELAY_SECONDS = 0.5  # Reduced from 2.0 - only used for Icypeas now
+API_DELAY_SECONDS = float(os.getenv('API_DELAY_SECONDS', '0.5'))  # Reduced from 2.0 - only used for Icypeas now
 BATCH_DELAY_SECONDS = 0.5  # Reduced from 2 - minimal delay between batches
 
 # Parallel Processing Configuration
-ENRICHMENT_WORKERS = 10  # Number of parallel workers for email enrichment
-PROSP_WORKERS = 5  # Number of parallel workers for Prosp push
+ENRICHMENT_WORKERS = int(os.getenv('ENRICHMENT_WORKERS', '10'))  # Number of parallel workers for email enrichment
+PROSP_WORKERS = int(os.getenv('PROSP_WORKERS', '5'))  # Parallel workers (and pooled connections) for Prosp push
+PROSP_RETRY_RPS = float(os.getenv('PROSP_RETRY_RPS', '1.0'))  # Request-rate ceiling for the Prosp retry pass
 
 # Retry Configuration
-MAX_RETRIES = 3
+MAX_RETRIES = int(os.getenv('MAX_RETRIES', '3'))
 RETRY_BACKOFF_BASE = 2  # Exponential backoff base (seconds)
+MAX_RETRY_AFTER = float(os.getenv('MAX_RETRY_AFTER', '120'))  # Cap (seconds) on a server-sent Retry-After wait
 
 
 def validate_config():
@@ -0,0 +1,30 @@
+"""
+Counters module.
+Thread-safe counter shared by the progress trackers (Prosp push, Exa search).
+"""
+
+import threading
+
+
+class AtomicCounter:
+    """
+    Integer counter that worker threads can increment and read concurrently.
+
+    increment() updates under a lock and returns the new total, so each caller
+    sees a distinct value. Reading `value` takes no lock and consumes nothing:
+    reading a single int attribute is atomic.
+    """
+
+    def __init__(self, start: int = 0):
+        self._value = start
+        self._lock = threading.Lock()
+
+    def increment(self, amount: int = 1) -> int:
+        """Add `amount` and return the new total."""
+        with self._lock:
+            self._value += amount
+            return self._value
+
+    @property
+    def value(self) -> int:
+        return self._value
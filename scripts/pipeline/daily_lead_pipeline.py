@@ -24,14 +24,15 @@ import sys
 import time
 import argparse
 from datetime import datetime
+from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(__file__).replace('\\', '/').rsplit('/', 2)[0])
+# Add parent directory (scripts/) to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
 from pipeline.config import validate_config, get_job_count
 from pipeline.db_logger import init_database, PipelineRun, get_unpushed_leads
 from pipeline.linkedin_scraper import scrape_linkedin_jobs
-from pipeline.company_filter import filter_companies, filter_software_companies, prepare_for_search
+from pipeline.company_filter import filter_and_classify, prepare_for_search
 from pipeline.decision_maker_search import search_decision_makers
 from pipeline.email_enricher import enrich_with_emails
 from pipeline.campaign_pusher import push_to_campaigns
@@ -84,7 +85,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
         job_count = get_job_count(test_mode)
         jobs = scrape_linkedin_jobs(job_count, pipeline_run)
         stage_times['1_scrape'] = time.time() - stage_start
-        print(f'⏱️  Stage 1 completed in {stage_times["1_scrape"]:.1f}s')
+        print(f'[TIME] Stage 1 completed in {stage_times["1_scrape"]:.1f}s')
 
         if not jobs:
             raise Exception('No jobs scraped from LinkedIn')
@@ -95,21 +96,22 @@ def run_pipeline(test_mode: bool = False) -> dict:
         print('=' * 40)
 
         stage_start = time.time()
-        filtered_companies = filter_companies(jobs, pipeline_run)
+        # Filter + software keyword classification in one pass
+        filtered_companies, software_companies = filter_and_classify(jobs, pipeline_run)
 
         if not filtered_companies:
             raise Exception('No companies passed filtering')
 
-        # Optional: Additional software company filter
-        software_companies = filter_software_companies(filtered_companies, pipeline_run)
-
         # Prepare for search
         companies_to_search = prepare_for_search(software_companies)
         stage_times['2_filter'] = time.time() - stage_start
-        print(f'⏱️  Stage 2 completed in {stage_times["2_filter"]:.1f}s')
+        print(f'[TIME] Stage 2 completed in {stage_times["2_filter"]:.1f}s')
 
         print(f'\nCompanies ready for search: {len(companies_to_search)}')
 
+        if not companies_to_search:
+            raise Exception('No companies ready for search')
+
         # Stage 3: Search for decision makers
         print('\n' + '=' * 40)
         print('STAGE 3: Searching for Decision Makers')
@@ -118,7 +120,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
         stage_start = time.time()
         decision_makers = search_decision_makers(companies_to_search, pipeline_run)
         stage_times['3_search'] = time.time() - stage_start
-        print(f'⏱️  Stage 3 completed in {stage_times["3_search"]:.1f}s')
+        print(f'[TIME] Stage 3 completed in {stage_times["3_search"]:.1f}s')
 
         if not decision_makers:
             raise Exception('No decision makers found')
@@ -131,7 +133,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
         stage_start = time.time()
         enriched_leads = enrich_with_emails(decision_makers, pipeline_run)
         stage_times['4_enrich'] = time.time() - stage_start
-        print(f'⏱️  Stage 4 completed in {stage_times["4_enrich"]:.1f}s')
+        print(f'[TIME] Stage 4 completed in {stage_times["4_enrich"]:.1f}s')
 
         # Stage 5: Validate leads
         print('\n' + '=' * 40)
@@ -142,7 +144,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
         stage_id = pipeline_run.start_stage('validate', input_count=len(enriched_leads))
 
         valid_leads = []
-        invalid_count = 0
+        invalid_leads = []
 
         for lead in enriched_leads:
             # Check required fields
@@ -152,20 +154,23 @@ def run_pipeline(test_mode: bool = False) -> dict:
             has_linkedin = bool(lead.get('linkedin_url'))
 
             if has_company and has_name and (has_email or has_linkedin):
-                # Store lead in database
-                lead_id = pipeline_run.add_lead({
-                    **lead,
-                    'status': 'validated'
-                })
-                lead['db_id'] = lead_id
                 valid_leads.append(lead)
             else:
-                invalid_count += 1
-                pipeline_run.add_lead({
-                    **lead,
-                    'status': 'failed',
-                    'failure_reason': 'Missing required fields'
-                })
+                invalid_leads.append(lead)
+
+        # Store leads in bulk, both statuses in one transaction
+        with pipeline_run.transaction():
+            if valid_leads:
+                lead_ids = pipeline_run.bulk_add_leads(valid_leads, status='validated')
+                for lead, lead_id in zip(valid_leads, lead_ids):
+                    lead['db_id'] = lead_id
+            if invalid_leads:
+                pipeline_run.bulk_add_leads(
+                    invalid_leads,
+                    status='failed',
+                    failure_reason='Missing required fields'
+                )
+        invalid_count = len(invalid_leads)
 
         print(f'Validated: {len(valid_leads)} leads')
         print(f'Invalid: {invalid_count} leads')
@@ -176,7 +181,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
             error_count=invalid_count
         )
         stage_times['5_validate'] = time.time() - stage_start
-        print(f'⏱️  Stage 5 completed in {stage_times["5_validate"]:.1f}s')
+        print(f'[TIME] Stage 5 completed in {stage_times["5_validate"]:.1f}s')
 
         # Stage 6: Push to campaigns
         print('\n' + '=' * 40)
@@ -188,7 +193,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
         # RESUME CAPABILITY: Check for unpushed leads from previous runs
         unpushed_from_previous = get_unpushed_leads('pushed_prosp')
         if unpushed_from_previous:
-            print(f'\n📥 Found {len(unpushed_from_previous)} unpushed leads from previous runs')
+            print(f'\n[RESUME] Found {len(unpushed_from_previous)} unpushed leads from previous runs')
             # Convert DB format to lead format and merge with current run's leads
             for lead in unpushed_from_previous:
                 lead['db_id'] = lead['id']  # Ensure db_id is set for status updates
@@ -200,7 +205,7 @@ def run_pipeline(test_mode: bool = False) -> dict:
 
         push_results = push_to_campaigns(all_leads_to_push, pipeline_run)
         stage_times['6_push'] = time.time() - stage_start
-        print(f'⏱️  Stage 6 completed in {stage_times["6_push"]:.1f}s')
+        print(f'[TIME] Stage 6 completed in {stage_times["6_push"]:.1f}s')
 
         # Complete pipeline run
         pipeline_run.complete('completed')
@@ -3,14 +3,71 @@ Database logger module for tracking pipeline runs, metrics, and errors.
 Uses SQLite for persistent storage.
 """
 
+import atexit
+import copy
+import functools
 import sqlite3
-import json
-from datetime import datetime
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from contextlib import contextmanager
 
 from .config import DATABASE_PATH
+from .json_codec import json_dumps_text
+
+
+# Current UTC time as naive ISO 8601 (same shape the dashboard already parses),
+# generated by SQLite so writes don't format timestamps in Python
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%f', 'now')"
+
+# Hot statements as module constants: identical SQL text lets sqlite3's
+# per-connection statement cache reuse the compiled statement.
+_SQL_CREATE_RUN = '''INSERT INTO pipeline_runs (config_json) VALUES (?)'''
+_SQL_COMPLETE_RUN = f'''UPDATE pipeline_runs
+                       SET completed_at = {_SQL_NOW}, status = ?, error_message = ?
+                       WHERE id = ?'''
+_SQL_START_STAGE = '''INSERT INTO stage_metrics (run_id, stage, input_count)
+                      VALUES (?, ?, ?)'''
+_SQL_COMPLETE_STAGE = f'''UPDATE stage_metrics
+                         SET completed_at = {_SQL_NOW}, output_count = ?, error_count = ?, error_details = ?
+                         WHERE id = ?'''
+_SQL_LOG_ERROR = '''INSERT INTO error_logs (run_id, stage, error_type, error_message, context_json)
+                    VALUES (?, ?, ?, ?, ?)'''
+_SQL_INSERT_LEAD = '''INSERT INTO leads (
+                        run_id, company_name, company_domain, job_title, employee_count,
+                        location, person_name, person_first_name, person_last_name,
+                        person_title, linkedin_url, email, email_certainty, email_verified,
+                        status, failure_reason
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)'''
+
+
+def _lead_params(
+    run_id: int,
+    lead_data: Dict[str, Any],
+    status: Optional[str] = None,
+    failure_reason: Optional[str] = None
+) -> tuple:
+    """Parameters for _SQL_INSERT_LEAD."""
+    return (
+        run_id,
+        lead_data.get('company_name'),
+        lead_data.get('company_domain'),
+        lead_data.get('job_title'),
+        lead_data.get('employee_count'),
+        lead_data.get('location'),
+        lead_data.get('person_name'),
+        lead_data.get('person_first_name'),
+        lead_data.get('person_last_name'),
+        lead_data.get('person_title'),
+        lead_data.get('linkedin_url'),
+        lead_data.get('email'),
+        lead_data.get('email_certainty'),
+        lead_data.get('email_verified', False),
+        status or lead_data.get('status', 'created'),
+        failure_reason or lead_data.get('failure_reason')
+    )
 
 
 def init_database():
@@ -20,25 +77,193 @@ def init_database():
         schema = f.read()
 
     with get_connection() as conn:
-        # Set up optimizations for concurrent access
+        # WAL is persistent in the database file; per-connection PRAGMAs are in _connect()
         conn.execute('PRAGMA journal_mode=WAL')  # Write-Ahead Logging for better concurrency
-        conn.execute('PRAGMA synchronous=NORMAL')  # Balance safety and speed
-        conn.execute('PRAGMA cache_size=10000')  # Larger cache
-        conn.execute('PRAGMA temp_store=MEMORY')  # Use memory for temp storage
-        
+
         conn.executescript(schema)
-        conn.commit()
+        _commit(conn)
+
+
+# One persistent connection per thread (sqlite3 connections must not be shared
+# across threads while in use). Reusing them keeps SQLite's page cache and the
+# module's statement cache warm instead of reconnecting on every call.
+_local = threading.local()
+_all_connections: List[sqlite3.Connection] = []
+_all_connections_lock = threading.Lock()
+
+
+class _ThreadOwner:
+    """Stored in _local; collected when its thread exits, closing that thread's connections."""
+
+
+def _close_connection(conn: sqlite3.Connection):
+    """Refresh planner statistics and close a connection, ignoring errors."""
+    try:
+        # Refresh query-planner statistics for tables whose size changed
+        # (cheap no-op otherwise; fails harmlessly on read-only connections)
+        conn.execute('PRAGMA analysis_limit=400')
+        conn.execute('PRAGMA optimize')
+    except sqlite3.Error:
+        pass
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _release_connection(conn: sqlite3.Connection):
+    """Close a connection whose thread has exited (unless close_connections() already did)."""
+    with _all_connections_lock:
+        try:
+            _all_connections.remove(conn)
+        except ValueError:
+            return
+    _close_connection(conn)
+
+
+def _track_connection(conn: sqlite3.Connection):
+    """
+    Register a new per-thread connection.
+
+    It is closed when the owning thread exits (short-lived worker threads
+    would otherwise leave their connections open until process exit), or
+    by close_connections() at exit, whichever comes first.
+    """
+    with _all_connections_lock:
+        _all_connections.append(conn)
+    owner = getattr(_local, 'owner', None)
+    if owner is None:
+        owner = _local.owner = _ThreadOwner()
+    weakref.finalize(owner, _release_connection, conn)
+
+# SQLite allows a single writer at a time; serializing writers in-process means
+# threads queue here instead of spinning on SQLITE_BUSY. Reentrant so that
+# writes nested in PipelineRun.transaction() don't deadlock.
+_write_lock = threading.RLock()
+
+
+def _connect(read_only: bool = False) -> sqlite3.Connection:
+    """Open and configure a new database connection."""
+    # check_same_thread=False only so close_connections() can close it at exit;
+    # each connection is still used by a single thread.
+    if read_only:
+        # No shared cache: it would put readers back behind the writer's table locks
+        conn = sqlite3.connect(
+            f'{DATABASE_PATH.resolve().as_uri()}?mode=ro',
+            uri=True, timeout=30.0, check_same_thread=False
+        )
+        conn.execute('PRAGMA query_only=1')
+    else:
+        conn = sqlite3.connect(str(DATABASE_PATH), timeout=30.0, check_same_thread=False)  # 30 second timeout for locks
+    conn.execute('PRAGMA busy_timeout=30000')  # Lock waits are retried inside SQLite for up to 30s
+    conn.row_factory = sqlite3.Row
+
+    # These reset on every new connection, so they must be set here, not once at init
+    conn.execute('PRAGMA synchronous=NORMAL')  # Balance safety and speed (one fsync per WAL checkpoint)
+    conn.execute('PRAGMA cache_size=-20000')  # ~20 MB page cache
+    conn.execute('PRAGMA temp_store=MEMORY')  # Use memory for temp storage
+    conn.execute('PRAGMA mmap_size=268435456')  # Memory-map up to 256 MB for reads
+    return conn
+
+
+# Rows fetched per query when streaming leads (PipelineRun.iter_* methods)
+_LEAD_PAGE_SIZE = 1000
+
+# Bumped whenever this process writes to the database; invalidates _cached_query results
+_db_generation = 0
 
 
 @contextmanager
 def get_connection():
-    """Context manager for database connections with lock timeout."""
-    conn = sqlite3.connect(str(DATABASE_PATH), timeout=30.0)  # 30 second timeout for locks
-    conn.row_factory = sqlite3.Row
+    """Context manager yielding this thread's persistent (write) database connection."""
+    global _db_generation
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = _local.conn = _connect()
+        _track_connection(conn)
+    with _write_lock:
+        changes_before = conn.total_changes
+        try:
+            yield conn
+        except BaseException:
+            # Don't leave a half-done transaction open on the shared connection
+            # (inside PipelineRun.transaction() the outermost block decides)
+            if conn.in_transaction and not getattr(_local, 'tx_depth', 0):
+                conn.rollback()
+            raise
+        finally:
+            if conn.total_changes != changes_before:
+                _db_generation += 1
+
+
+@contextmanager
+def get_read_connection():
+    """
+    Context manager yielding this thread's read-only database connection.
+
+    With WAL, readers see the last committed state without waiting on the
+    writer, so the get_* query functions use this and never take _write_lock.
+    """
+    conn = getattr(_local, 'read_conn', None)
+    if conn is None:
+        conn = _local.read_conn = _connect(read_only=True)
+        _track_connection(conn)
     try:
         yield conn
     finally:
-        conn.close()
+        # End the implicit read transaction so the next query sees fresh commits
+        if conn.in_transaction:
+            conn.rollback()
+
+
+def _commit(conn: sqlite3.Connection):
+    """Commit, unless inside PipelineRun.transaction() (which commits once at the end)."""
+    if not getattr(_local, 'tx_depth', 0):
+        conn.commit()
+
+
+def _cached_query(ttl: float):
+    """
+    Cache a read-only query function's result per argument tuple.
+
+    Entries expire after `ttl` seconds (covers writes from other processes)
+    or as soon as this process writes to the database. Callers get a copy,
+    so mutating a result can't corrupt the cache.
+    """
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] == _db_generation and now - entry[1] < ttl:
+                return copy.deepcopy(entry[2])
+
+            generation = _db_generation
+            result = func(*args, **kwargs)
+            with lock:
+                cache[key] = (generation, now, result)
+            return copy.deepcopy(result)
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+
+@atexit.register
+def close_connections():
+    """Close every connection opened by get_connection() / get_read_connection()."""
+    with _all_connections_lock:
+        connections = _all_connections[:]
+        _all_connections.clear()
+    for conn in connections:
+        _close_connection(conn)
+    _local.__dict__.pop('conn', None)
+    _local.__dict__.pop('read_conn', None)
 
 
 class PipelineRun:
@@ -51,52 +276,67 @@ class PipelineRun:
         if run_id is None:
             self._create_run()
 
+    @contextmanager
+    def transaction(self):
+        """
+        Group several writes into a single transaction (one COMMIT).
+
+        Usage:
+            with pipeline_run.transaction():
+                pipeline_run.bulk_add_leads(valid, status='validated')
+                pipeline_run.log_error(...)
+
+        Nested blocks join the outer transaction. Any exception rolls back
+        everything written inside the outermost block.
+        """
+        with get_connection() as conn:
+            depth = getattr(_local, 'tx_depth', 0)
+            if depth == 0 and not conn.in_transaction:
+                conn.execute('BEGIN IMMEDIATE')  # Take the write lock up front
+            _local.tx_depth = depth + 1
+            try:
+                yield self
+            except BaseException:
+                _local.tx_depth = depth
+                if depth == 0 and conn.in_transaction:
+                    conn.rollback()
+                raise
+            _local.tx_depth = depth
+            if depth == 0:
+                conn.commit()
+
     def _create_run(self):
         """Create a new pipeline run record."""
         with get_connection() as conn:
             cursor = conn.execute(
-                '''INSERT INTO pipeline_runs (config_json) VALUES (?)''',
-                (json.dumps(self.config),)
+                _SQL_CREATE_RUN,
+                (json_dumps_text(self.config),)
             )
             self.run_id = cursor.lastrowid
-            conn.commit()
+            _commit(conn)
 
     def complete(self, status: str = 'completed', error_message: Optional[str] = None):
         """Mark the pipeline run as completed."""
-        max_retries = 5
-        retry_count = 0
-        
-        while retry_count < max_retries:
-            try:
-                with get_connection() as conn:
-                    conn.execute(
-                        '''UPDATE pipeline_runs
-                           SET completed_at = ?, status = ?, error_message = ?
-                           WHERE id = ?''',
-                        (datetime.utcnow().isoformat(), status, error_message, self.run_id)
-                    )
-                    conn.commit()
-                return  # Success
-            except Exception as e:
-                retry_count += 1
-                if retry_count < max_retries:
-                    import time
-                    wait_time = 2 ** retry_count
-                    print(f"\nRetrying pipeline completion (attempt {retry_count}/{max_retries}, waiting {wait_time}s): {str(e)[:100]}")
-                    time.sleep(wait_time)
-                else:
-                    raise Exception(f"Failed to complete pipeline after {max_retries} attempts: {str(e)}")
+        # Lock contention is retried inside SQLite by the connection's busy timeout
+        try:
+            with get_connection() as conn:
+                conn.execute(
+                    _SQL_COMPLETE_RUN,
+                    (status, error_message, self.run_id)
+                )
+                _commit(conn)
+        except sqlite3.OperationalError as e:
+            raise Exception(f"Failed to complete pipeline: {e}") from e
 
     def start_stage(self, stage: str, input_count: int = 0) -> int:
         """Start tracking a new stage."""
         with get_connection() as conn:
             cursor = conn.execute(
-                '''INSERT INTO stage_metrics (run_id, stage, input_count)
-                   VALUES (?, ?, ?)''',
+                _SQL_START_STAGE,
                 (self.run_id, stage, input_count)
             )
             stage_id = cursor.lastrowid
-            conn.commit()
+            _commit(conn)
             return stage_id
 
     def complete_stage(
@@ -107,40 +347,24 @@ class PipelineRun:
         error_details: Optional[List[Dict]] = None
     ):
         """Mark a stage as completed with metrics."""
-        max_retries = 5
-        retry_count = 0
-        last_error = None
-        
-        while retry_count < max_retries:
-            try:
-                with get_connection() as conn:
-                    # Serialize error details first to catch any JSON errors
-                    error_json = json.dumps(error_details) if error_details else None
-                    
-                    conn.execute(
-                        '''UPDATE stage_metrics
-                           SET completed_at = ?, output_count = ?, error_count = ?, error_details = ?
-                           WHERE id = ?''',
-                        (
-                            datetime.utcnow().isoformat(),
-                            output_count,
-                            error_count,
-                            error_json,
-                            stage_id
-                        )
+        # Serialize error details first so a JSON error never leaves a write half done
+        error_json = json_dumps_text(error_details) if error_details else None
+
+        # Lock contention is retried inside SQLite by the connection's busy timeout
+        try:
+            with get_connection() as conn:
+                conn.execute(
+                    _SQL_COMPLETE_STAGE,
+                    (
+                        output_count,
+                        error_count,
+                        error_json,
+                        stage_id
                     )
-                    conn.commit()
-                return  # Success
-            except Exception as e:
-                last_error = e
-                retry_count += 1
-                if retry_count < max_retries:
-                    import time
-                    wait_time = 2 ** retry_count  # Exponential backoff
-                    print(f"\nRetrying stage completion (attempt {retry_count}/{max_retries}, waiting {wait_time}s): {str(e)[:100]}")
-                    time.sleep(wait_time)
-                else:
-                    raise Exception(f"Failed to complete stage after {max_retries} attempts: {str(last_error)}")
+                )
+                _commit(conn)
+        except sqlite3.OperationalError as e:
+            raise Exception(f"Failed to complete stage: {e}") from e
 
     def log_error(
         self,
@@ -152,62 +376,61 @@ class PipelineRun:
         """Log an error to the error_logs table."""
         with get_connection() as conn:
             conn.execute(
-                '''INSERT INTO error_logs (run_id, stage, error_type, error_message, context_json)
-                   VALUES (?, ?, ?, ?, ?)''',
+                _SQL_LOG_ERROR,
                 (
                     self.run_id,
                     stage,
                     error_type,
                     error_message,
-                    json.dumps(context) if context else None
+                    json_dumps_text(context) if context else None
                 )
             )
-            conn.commit()
+            _commit(conn)
+
+    def log_errors_bulk(self, errors: List[Tuple[str, str, str, Optional[Dict]]]):
+        """
+        Log several errors in a single transaction.
+
+        Args:
+            errors: (stage, error_type, error_message, context) tuples,
+                    same arguments as log_error()
+        """
+        if not errors:
+            return
+
+        rows = [
+            (
+                self.run_id,
+                stage,
+                error_type,
+                error_message,
+                json_dumps_text(context) if context else None
+            )
+            for stage, error_type, error_message, context in errors
+        ]
+        with get_connection() as conn:
+            conn.executemany(_SQL_LOG_ERROR, rows)
+            _commit(conn)
 
     def add_lead(self, lead_data: Dict[str, Any]) -> int:
         """Add a lead to the database."""
         with get_connection() as conn:
-            cursor = conn.execute(
-                '''INSERT INTO leads (
-                    run_id, company_name, company_domain, job_title, employee_count,
-                    location, person_name, person_first_name, person_last_name,
-                    person_title, linkedin_url, email, email_certainty, email_verified,
-                    status, failure_reason
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                (
-                    self.run_id,
-                    lead_data.get('company_name'),
-                    lead_data.get('company_domain'),
-                    lead_data.get('job_title'),
-                    lead_data.get('employee_count'),
-                    lead_data.get('location'),
-                    lead_data.get('person_name'),
-                    lead_data.get('person_first_name'),
-                    lead_data.get('person_last_name'),
-                    lead_data.get('person_title'),
-                    lead_data.get('linkedin_url'),
-                    lead_data.get('email'),
-                    lead_data.get('email_certainty'),
-                    lead_data.get('email_verified', False),
-                    lead_data.get('status', 'created'),
-                    lead_data.get('failure_reason')
-                )
-            )
+            cursor = conn.execute(_SQL_INSERT_LEAD, _lead_params(self.run_id, lead_data))
             lead_id = cursor.lastrowid
-            conn.commit()
+            _commit(conn)
             return lead_id
 
     def update_lead(self, lead_id: int, updates: Dict[str, Any]):
         """Update a lead record."""
-        # Build dynamic UPDATE query
+        # Build dynamic UPDATE query; sorted column order keeps the SQL text
+        # stable for the statement cache
         set_clauses = []
         values = []
-        for key, value in updates.items():
+        for key, value in sorted(updates.items()):
             set_clauses.append(f'{key} = ?')
             values.append(value)
 
-        set_clauses.append('updated_at = ?')
-        values.append(datetime.utcnow().isoformat())
+        set_clauses.append(f'updated_at = {_SQL_NOW}')
         values.append(lead_id)
 
         with get_connection() as conn:
@@ -215,67 +438,105 @@ class PipelineRun:
                 f'''UPDATE leads SET {', '.join(set_clauses)} WHERE id = ?''',
                 values
             )
-            conn.commit()
+            _commit(conn)
+
+    def bulk_add_leads(
+        self,
+        leads: List[Dict[str, Any]],
+        status: Optional[str] = None,
+        failure_reason: Optional[str] = None
+    ) -> List[int]:
+        """
+        Add multiple leads in a single transaction.
+
+        status / failure_reason, when given, apply to every lead and take
+        precedence over the per-lead values (saves copying each lead dict).
+        """
+        if not leads:
+            return []
+
+        rows = [_lead_params(self.run_id, lead_data, status, failure_reason) for lead_data in leads]
 
-    def bulk_add_leads(self, leads: List[Dict[str, Any]]) -> List[int]:
-        """Add multiple leads in a single transaction."""
-        lead_ids = []
         with get_connection() as conn:
-            for lead_data in leads:
-                cursor = conn.execute(
-                    '''INSERT INTO leads (
-                        run_id, company_name, company_domain, job_title, employee_count,
-                        location, person_name, person_first_name, person_last_name,
-                        person_title, linkedin_url, email, email_certainty, email_verified,
-                        status, failure_reason
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                    (
-                        self.run_id,
-                        lead_data.get('company_name'),
-                        lead_data.get('company_domain'),
-                        lead_data.get('job_title'),
-                        lead_data.get('employee_count'),
-                        lead_data.get('location'),
-                        lead_data.get('person_name'),
-                        lead_data.get('person_first_name'),
-                        lead_data.get('person_last_name'),
-                        lead_data.get('person_title'),
-                        lead_data.get('linkedin_url'),
-                        lead_data.get('email'),
-                        lead_data.get('email_certainty'),
-                        lead_data.get('email_verified', False),
-                        lead_data.get('status', 'created'),
-                        lead_data.get('failure_reason')
-                    )
-                )
-                lead_ids.append(cursor.lastrowid)
-            conn.commit()
-        return lead_ids
+            conn.executemany(_SQL_INSERT_LEAD, rows)
+            # The transaction holds the write lock and leads has no triggers, so
+            # the AUTOINCREMENT ids of this batch are contiguous
+            last_id = conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+            _commit(conn)
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    def _iter_leads(self, condition: str, params: tuple) -> Iterator[Dict]:
+        """
+        Stream this run's leads matching `condition`, in id order.
+
+        Pages are fetched by id on the read-only connection and each page's
+        statement is finished before rows are yielded, so a paused or
+        abandoned generator holds no statement or read snapshot open.
+        """
+        last_id = 0
+        while True:
+            with get_read_connection() as conn:
+                rows = conn.execute(
+                    f'''SELECT * FROM leads WHERE run_id = ? {condition} AND id > ?
+                        ORDER BY id LIMIT {_LEAD_PAGE_SIZE}''',
+                    (self.run_id, *params, last_id)
+                ).fetchall()
+            for row in rows:
+                yield dict(row)
+            if len(rows) < _LEAD_PAGE_SIZE:
+                return
+            last_id = rows[-1]['id']
+
+    def iter_leads_by_status(self, status: str) -> Iterator[Dict]:
+        """Stream leads with a specific status for this run, one dict at a time."""
+        return self._iter_leads('AND status = ?', (status,))
+
+    def iter_all_leads(self) -> Iterator[Dict]:
+        """Stream all leads for this run, one dict at a time."""
+        return self._iter_leads('', ())
 
     def get_leads_by_status(self, status: str) -> List[Dict]:
         """Get all leads with a specific status for this run."""
-        with get_connection() as conn:
-            cursor = conn.execute(
-                '''SELECT * FROM leads WHERE run_id = ? AND status = ?''',
-                (self.run_id, status)
-            )
-            return [dict(row) for row in cursor.fetchall()]
+        return list(self.iter_leads_by_status(status))
 
     def get_all_leads(self) -> List[Dict]:
         """Get all leads for this run."""
-        with get_connection() as conn:
-            cursor = conn.execute(
+        return list(self.iter_all_leads())
+
+    def get_all_leads_columnar(self) -> Dict[str, List]:
+        """
+        Get all leads for this run as columns instead of rows.
+
+        Avoids building one dict per lead; handy for aggregates and exports
+        that work a column at a time (e.g. pandas.DataFrame(columns)).
+
+        Returns:
+            Dict of column name -> list of values, one entry per lead
+        """
+        with get_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None  # Plain tuples; transposed below
+            cursor.execute(
                 '''SELECT * FROM leads WHERE run_id = ?''',
                 (self.run_id,)
             )
-            return [dict(row) for row in cursor.fetchall()]
+            rows = cursor.fetchall()
+        columns = [d[0] for d in cursor.description]
+        if not rows:
+            return {column: [] for column in columns}
+        return {column: list(values) for column, values in zip(columns, zip(*rows))}
 
 
 # Query functions for the monitoring dashboard
 
+# Dashboard aggregates are re-polled often but only change when a run writes
+SUMMARY_CACHE_TTL = 30  # Seconds
+
+
+@_cached_query(SUMMARY_CACHE_TTL)
 def get_all_runs(limit: int = 50) -> List[Dict]:
     """Get all pipeline runs, most recent first."""
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.execute(
             '''SELECT * FROM pipeline_runs ORDER BY started_at DESC LIMIT ?''',
             (limit,)
@@ -285,46 +546,79 @@ def get_all_runs(limit: int = 50) -> List[Dict]:
 
 def get_run_details(run_id: int) -> Optional[Dict]:
     """Get detailed information about a specific run."""
-    with get_connection() as conn:
+    return get_runs_details([run_id]).get(run_id)
+
+
+def get_runs_details(run_ids: List[int]) -> Dict[int, Dict]:
+    """
+    Get detailed information for several runs at once.
+
+    Runs four queries in total (runs, stages, lead counts, errors) regardless
+    of how many runs are requested, instead of four per run.
+
+    Args:
+        run_ids: Pipeline run IDs
+
+    Returns:
+        Dict of run_id -> run details (same shape as get_run_details);
+        unknown IDs are omitted
+    """
+    run_ids = list(run_ids)
+    if not run_ids:
+        return {}
+
+    placeholders = ','.join('?' * len(run_ids))
+
+    with get_read_connection() as conn:
         # Get run info
         cursor = conn.execute(
-            '''SELECT * FROM pipeline_runs WHERE id = ?''',
-            (run_id,)
+            f'''SELECT * FROM pipeline_runs WHERE id IN ({placeholders})''',
+            run_ids
         )
-        run = cursor.fetchone()
-        if not run:
-            return None
+        runs = {}
+        for row in cursor.fetchall():
+            run_dict = dict(row)
+            run_dict['stages'] = []
+            run_dict['lead_counts'] = {}
+            run_dict['errors'] = []
+            runs[run_dict['id']] = run_dict
 
-        run_dict = dict(run)
+        if not runs:
+            return {}
 
         # Get stage metrics
         cursor = conn.execute(
-            '''SELECT * FROM stage_metrics WHERE run_id = ? ORDER BY started_at''',
-            (run_id,)
+            f'''SELECT * FROM stage_metrics WHERE run_id IN ({placeholders})
+                ORDER BY run_id, started_at''',
+            run_ids
         )
-        run_dict['stages'] = [dict(row) for row in cursor.fetchall()]
+        for row in cursor.fetchall():
+            runs[row['run_id']]['stages'].append(dict(row))
 
         # Get lead counts by status
         cursor = conn.execute(
-            '''SELECT status, COUNT(*) as count FROM leads
-               WHERE run_id = ? GROUP BY status''',
-            (run_id,)
+            f'''SELECT run_id, status, COUNT(*) as count FROM leads
+                WHERE run_id IN ({placeholders}) GROUP BY run_id, status''',
+            run_ids
         )
-        run_dict['lead_counts'] = {row['status']: row['count'] for row in cursor.fetchall()}
+        for row in cursor.fetchall():
+            runs[row['run_id']]['lead_counts'][row['status']] = row['count']
 
         # Get error logs
         cursor = conn.execute(
-            '''SELECT * FROM error_logs WHERE run_id = ? ORDER BY created_at''',
-            (run_id,)
+            f'''SELECT * FROM error_logs WHERE run_id IN ({placeholders})
+                ORDER BY run_id, created_at''',
+            run_ids
         )
-        run_dict['errors'] = [dict(row) for row in cursor.fetchall()]
+        for row in cursor.fetchall():
+            runs[row['run_id']]['errors'].append(dict(row))
 
-        return run_dict
+        return runs
 
 
 def get_latest_run() -> Optional[Dict]:
     """Get the most recent pipeline run with details."""
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.execute(
             '''SELECT id FROM pipeline_runs ORDER BY started_at DESC LIMIT 1'''
         )
@@ -334,22 +628,22 @@ def get_latest_run() -> Optional[Dict]:
         return None
 
 
+@_cached_query(SUMMARY_CACHE_TTL)
 def get_run_summary_stats() -> Dict:
     """Get summary statistics across all runs."""
-    with get_connection() as conn:
-        # Total runs
-        cursor = conn.execute('''SELECT COUNT(*) as total FROM pipeline_runs''')
-        total_runs = cursor.fetchone()['total']
-
-        # Successful runs
+    with get_read_connection() as conn:
+        # Run and lead totals in one statement
         cursor = conn.execute(
-            '''SELECT COUNT(*) as total FROM pipeline_runs WHERE status = 'completed' '''
+            '''SELECT
+                (SELECT COUNT(*) FROM pipeline_runs) as total_runs,
+                (SELECT COUNT(*) FROM pipeline_runs WHERE status = 'completed') as successful_runs,
+                (SELECT COUNT(*) FROM leads) as total_leads,
+                (SELECT COUNT(DISTINCT run_id) FROM leads) as runs_with_leads'''
         )
-        successful_runs = cursor.fetchone()['total']
-
-        # Total leads created
-        cursor = conn.execute('''SELECT COUNT(*) as total FROM leads''')
-        total_leads = cursor.fetchone()['total']
+        totals = cursor.fetchone()
+        total_runs = totals['total_runs']
+        successful_runs = totals['successful_runs']
+        total_leads = totals['total_leads']
 
         # Leads by status
         cursor = conn.execute(
@@ -357,15 +651,9 @@ def get_run_summary_stats() -> Dict:
         )
         leads_by_status = {row['status']: row['count'] for row in cursor.fetchall()}
 
-        # Average leads per successful run
-        cursor = conn.execute(
-            '''SELECT AVG(lead_count) as avg_leads FROM (
-                SELECT run_id, COUNT(*) as lead_count FROM leads
-                GROUP BY run_id
-            )'''
-        )
-        avg_row = cursor.fetchone()
-        avg_leads_per_run = avg_row['avg_leads'] if avg_row['avg_leads'] else 0
+        # Average leads per run (over runs that have leads)
+        runs_with_leads = totals['runs_with_leads']
+        avg_leads_per_run = total_leads / runs_with_leads if runs_with_leads else 0
 
         return {
             'total_runs': total_runs,
@@ -395,7 +683,7 @@ def get_unpushed_leads(target_status: str = 'pushed_prosp') -> List[Dict]:
     else:
         incomplete_statuses = ('validated',)
 
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         placeholders = ','.join('?' * len(incomplete_statuses))
         cursor = conn.execute(
             f'''SELECT * FROM leads
@@ -415,7 +703,7 @@ def get_unpushed_email_leads() -> List[Dict]:
     Returns:
         List of lead dictionaries that need email push
     """
-    with get_connection() as conn:
+    with get_read_connection() as conn:
         cursor = conn.execute(
             '''SELECT * FROM leads
                 WHERE status = 'validated'
@@ -426,6 +714,77 @@ def get_unpushed_email_leads() -> List[Dict]:
         return [dict(row) for row in cursor.fetchall()]
 
 
+def get_exa_cache(key: str, max_age_seconds: float) -> Optional[str]:
+    """
+    Get a cached Exa search payload if it is fresh enough.
+
+    Args:
+        key: Cache key (hash of the query and search parameters)
+        max_age_seconds: Maximum age of a usable entry
+
+    Returns:
+        JSON payload string, or None if missing or expired
+    """
+    with get_read_connection() as conn:
+        cursor = conn.execute(
+            '''SELECT payload FROM exa_query_cache WHERE key = ? AND created_at > ?''',
+            (key, time.time() - max_age_seconds)
+        )
+        row = cursor.fetchone()
+        return row['payload'] if row else None
+
+
+def set_exa_cache(key: str, payload: str):
+    """Store (or refresh) a cached Exa search payload."""
+    with get_connection() as conn:
+        conn.execute(
+            '''INSERT OR REPLACE INTO exa_query_cache (key, created_at, payload) VALUES (?, ?, ?)''',
+            (key, time.time(), payload)
+        )
+        _commit(conn)
+
+
+def get_email_cache(keys: List[str], max_age_seconds: float) -> Dict[str, str]:
+    """
+    Get cached email search payloads that are fresh enough.
+
+    Args:
+        keys: Cache keys (hashes of the lowercased name + domain)
+        max_age_seconds: Maximum age of a usable entry
+
+    Returns:
+        Dictionary mapping key -> JSON payload string for the keys found
+    """
+    found = {}
+    cutoff = time.time() - max_age_seconds
+    with get_read_connection() as conn:
+        # Chunked to stay under SQLite's bound-parameter limit
+        for i in range(0, len(keys), 500):
+            chunk = keys[i:i + 500]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(
+                f'''SELECT key, payload FROM email_search_cache
+                    WHERE key IN ({placeholders}) AND created_at > ?''',
+                chunk + [cutoff]
+            )
+            found.update((row['key'], row['payload']) for row in cursor)
+    return found
+
+
+def set_email_cache(entries: List[Tuple[str, str]]):
+    """Store (or refresh) cached email search payloads, as (key, payload) pairs."""
+    if not entries:
+        return
+
+    now = time.time()
+    with get_connection() as conn:
+        conn.executemany(
+            '''INSERT OR REPLACE INTO email_search_cache (key, created_at, payload) VALUES (?, ?, ?)''',
+            [(key, now, payload) for key, payload in entries]
+        )
+        _commit(conn)
+
+
 def bulk_update_lead_status(lead_ids: List[int], status: str):
     """
     Update status for multiple leads in a single transaction.
@@ -442,8 +801,8 @@ def bulk_update_lead_status(lead_ids: List[int], status: str):
         placeholders = ','.join('?' * len(lead_ids))
         conn.execute(
             f'''UPDATE leads
-                SET status = ?, updated_at = ?
+                SET status = ?, updated_at = {_SQL_NOW}
                 WHERE id IN ({placeholders})''',
-            [status, datetime.utcnow().isoformat()] + lead_ids
+            [status] + lead_ids
         )
-        conn.commit()
+        _commit(conn)
@@ -4,21 +4,34 @@ Finds CTOs, Heads of Engineering, and similar roles at target companies.
 Uses parallel processing for faster execution.
 """
 
+import hashlib
 import re
 import time
+from collections import OrderedDict
+from operator import attrgetter
+from types import SimpleNamespace
 from typing import List, Dict, Any, Optional, Tuple
 from exa_py import Exa
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 import threading
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 
+# Optional: google-re2 (pip install google-re2) scans the title alternation
+# as a linear-time DFA; falls back to the stdlib re module
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 from .config import (
     EXA_API_KEY,
     EXA_SEARCH_LIMIT,
     EXA_API_DELAY,
     EXA_WORKERS,
+    EXA_CACHE_TTL_HOURS,
     MAX_RETRIES,
     RETRY_BACKOFF_BASE,
     OPENROUTER_API_KEY,
@@ -27,7 +40,10 @@ from .config import (
     LLM_VALIDATION_ENABLED,
     MAX_COMPANIES_PER_RUN
 )
-from .db_logger import PipelineRun
+from .counters import AtomicCounter
+from .db_logger import PipelineRun, get_exa_cache, set_exa_cache
+from .json_codec import json_dumps, json_dumps_text, json_loads
+from .rate_limit import TokenBucket
 
 
 # Patterns to identify C-level executives and founders only
@@ -53,32 +69,218 @@ TITLE_PATTERNS = [
     r'\bFounder\b',
 ]
 
+
+def _compile_title_re():
+    """All title patterns as one alternation: a single scan answers "any pattern matches?"."""
+    pattern = '(?i)' + '|'.join(f'(?:{p})' for p in TITLE_PATTERNS)
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except Exception:
+            pass  # Unsupported syntax in re2; use the stdlib engine
+    return re.compile(pattern)
+
+
+TITLE_RE = _compile_title_re()
+
+# Individually compiled too: extract_title_from_text needs the first pattern in
+# list order to match (priority), not the leftmost match in the text
+_TITLE_PATTERN_RES = [re.compile(p, re.IGNORECASE) for p in TITLE_PATTERNS]
+
+# Every TITLE_PATTERNS match contains one of these (uppercase) literals; a few
+# plain substring scans reject most titles before the regex runs
+_TITLE_KEYWORDS = ('CEO', 'CTO', 'CPO', 'COO', 'CHIEF', 'FOUNDER')
+
+# Unambiguous current C-level titles; with an exact employer match these skip LLM
+# validation. Founder titles stay ambiguous (often a previous or side company).
+HIGH_CONFIDENCE_TITLE_RE = re.compile(
+    r'\b(?:CEO|CTO|CPO|COO|Chief (?:Executive|Technology|Technical|Product|Operating) Officer)\b',
+    re.IGNORECASE
+)
+_PAST_ROLE_RE = re.compile(r'\b(?:former|ex|previously|past)\b', re.IGNORECASE)
+
+# LLM validation concurrency: per company, and in total across all search workers
+LLM_VALIDATION_WORKERS = 8
+LLM_MAX_CONCURRENT_REQUESTS = EXA_WORKERS * 4
+_llm_semaphore = threading.BoundedSemaphore(LLM_MAX_CONCURRENT_REQUESTS)
+
+# The "valid" field of an LLM validation reply
+_LLM_VERDICT_RE = re.compile(r'"valid"\s*:\s*(true|false)\b')
+
+# Leads per batched validation call, and the reply budget per lead
+LLM_VALIDATION_BATCH_SIZE = 10
+LLM_BATCH_TOKENS_PER_LEAD = 40
+
+# LLM verdicts keyed by the prompt inputs (see _verdict_key). Replies are
+# deterministic (temperature 0), so leads seen earlier in the run (retries,
+# companies repeated across job postings) reuse the verdict. Only definitive
+# verdicts are stored; failures are retried next time.
+LLM_VERDICT_CACHE_SIZE = 10000
+_verdict_cache: 'OrderedDict[Tuple[str, ...], bool]' = OrderedDict()
+_verdict_cache_lock = threading.Lock()
+
+
+def _create_openrouter_session() -> requests.Session:
+    """Create a keep-alive OpenRouter session with a pool sized for concurrent validation."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=EXA_WORKERS, pool_maxsize=LLM_MAX_CONCURRENT_REQUESTS, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Authorization': f'Bearer {OPENROUTER_API_KEY}',
+        'Content-Type': 'application/json'
+    })
+    return session
+
+
+# Shared by all search workers so LLM validation reuses pooled TCP/TLS connections
+_openrouter_session = _create_openrouter_session()
+
+# Fields read from every Exa result (Exa results and cached SimpleNamespaces both have all three)
+_RESULT_FIELDS = attrgetter('url', 'title', 'author')
+
+
+def _result_fields(result: Any) -> Tuple[str, str, str]:
+    """(url, title, author) of a search result, tolerating missing attributes."""
+    try:
+        return _RESULT_FIELDS(result)
+    except AttributeError:
+        return getattr(result, 'url', ''), getattr(result, 'title', ''), getattr(result, 'author', '')
+
+
+# One Exa client per worker thread, reused across all companies that thread
+# searches (the client holds an HTTP session that isn't shared across threads)
+_exa_local = threading.local()
+
+
+def _get_exa_client() -> Exa:
+    """This thread's Exa client, created on first use."""
+    exa = getattr(_exa_local, 'client', None)
+    if exa is None:
+        exa = _exa_local.client = Exa(api_key=EXA_API_KEY)
+    return exa
+
+
+# exa_py reports HTTP failures as "Request failed with status code <N>: <body>"
+_STATUS_429_RE = re.compile(r'\bstatus code 429\b')
+
+
+def _is_rate_limit_error(error: Exception) -> bool:
+    """Whether an Exa client error is an HTTP 429 (not just any text containing '429')."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    if status is not None:
+        return status == 429
+    return bool(_STATUS_429_RE.search(str(error)))
+
+
+def _exa_cache_key(query: str) -> str:
+    """Cache key for a people search (query + parameters that change the results)."""
+    raw = f'people|{EXA_SEARCH_LIMIT}|{query}'
+    return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def _cached_people_search(query: str) -> Optional[List[SimpleNamespace]]:
+    """Fresh cached results for a query, shaped like Exa results (url/title/author)."""
+    if EXA_CACHE_TTL_HOURS <= 0:
+        return None
+    try:
+        payload = get_exa_cache(_exa_cache_key(query), EXA_CACHE_TTL_HOURS * 3600)
+        if payload is None:
+            return None
+        return [SimpleNamespace(**item) for item in json_loads(payload)]
+    except Exception:
+        return None  # Cache is best-effort; fall back to a live search
+
+
+def _store_people_search(query: str, results: List[Any]):
+    """Cache the fields parse_people_search_results uses from each result."""
+    # Empty replies aren't cached: one bad or empty response would otherwise hide
+    # the company from search for the whole TTL
+    if EXA_CACHE_TTL_HOURS <= 0 or not results:
+        return
+    payload = [
+        dict(zip(('url', 'title', 'author'), _result_fields(result)))
+        for result in results
+    ]
+    try:
+        set_exa_cache(_exa_cache_key(query), json_dumps_text(payload))
+    except Exception:
+        pass  # Don't fail the search if the cache write fails
+
+
+# Exa people-search query, completed with the company name
+EXA_PEOPLE_QUERY_PREFIX = '(CTO OR CEO OR Cofounder OR Founder) at '
+
 LINKEDIN_URL_PATTERN = re.compile(r'linkedin\.com/in/([a-zA-Z0-9_-]+)')
 
+# Profile slug right after LINKEDIN_PROFILE_PREFIX (matched at a known offset,
+# so parsing needs no regex scan over the whole URL)
+LINKEDIN_PROFILE_PREFIX = 'linkedin.com/in/'
+_LINKEDIN_SLUG_RE = re.compile(r'[a-zA-Z0-9_-]+')
+
+# Company fields copied onto every lead found for that company
+LEAD_COMPANY_FIELDS = (
+    'company_name', 'company_domain', 'company_website',
+    'job_title', 'employee_count', 'location',
+)
+
+# Slug separators -> spaces in a single translate() pass
+_SLUG_TRANS = str.maketrans('-_', '  ')
+
 
 # Thread-safe counter for progress tracking
 class SearchProgressCounter:
     def __init__(self, total: int):
         self.total = total
-        self.completed = 0
-        self.with_results = 0
-        self.people_found = 0
-        self.lock = threading.Lock()
+        self._completed = AtomicCounter()
+        self._with_results = AtomicCounter()
+        self._people_found = AtomicCounter()
 
     def increment(self, found_count: int = 0):
-        with self.lock:
-            self.completed += 1
-            if found_count > 0:
-                self.with_results += 1
-                self.people_found += found_count
-            return self.completed
+        if found_count > 0:
+            self._with_results.increment()
+            self._people_found.increment(found_count)
+        return self._completed.increment()
+
+    @property
+    def people_found(self) -> int:
+        return self._people_found.value
 
     def get_stats(self):
-        with self.lock:
-            return self.completed, self.with_results, self.people_found
+        return self._completed.value, self._with_results.value, self._people_found.value
 
 
-LLM_VALIDATION_PROMPT = """You are validating if a person from a search result is a valid lead for B2B outreach.
+# Static parts of the LLM validation prompt; build_validation_prompt() fills in
+# the lead with an f-string instead of parsing a format template per lead
+_PROMPT_HEAD = 'You are validating if a person from a search result is a valid lead for B2B outreach.'
+_PROMPT_CRITERIA = """VALIDATION CRITERIA:
+1. Person MUST work at the target company (company name appears in their profile)
+2. Person MUST have a C-level or founder title: CEO, CTO, CPO, COO, Cofounder, or Founder
+3. Person MUST have a valid LinkedIn profile URL"""
+_PROMPT_TAIL = _PROMPT_CRITERIA + """
+
+Respond with JSON only:
+{"valid": true/false, "reason": "brief explanation"}"""
+_BATCH_PROMPT_HEAD = 'You are validating if people from search results are valid leads for B2B outreach.'
+_BATCH_PROMPT_TAIL = _PROMPT_CRITERIA + """
+
+Check each search result separately. Respond with JSON only: an array with
+exactly one object per search result, in the same order:
+[{"valid": true/false, "reason": "brief explanation"}, ...]"""
+
+
+def build_validation_prompt(
+    company_name: str,
+    company_domain: str,
+    person_name: str,
+    person_title: str,
+    linkedin_url: str,
+    source_title: str
+) -> str:
+    """Build the LLM validation prompt for one lead."""
+    return f"""{_PROMPT_HEAD}
 
 TARGET COMPANY: {company_name}
 TARGET COMPANY DOMAIN: {company_domain}
@@ -89,13 +291,47 @@ SEARCH RESULT:
 - LinkedIn URL: {linkedin_url}
 - Source Title: {source_title}
 
-VALIDATION CRITERIA:
-1. Person MUST work at the target company (company name appears in their profile)
-2. Person MUST have a C-level or founder title: CEO, CTO, CPO, COO, Cofounder, or Founder
-3. Person MUST have a valid LinkedIn profile URL
+{_PROMPT_TAIL}"""
+
+
+def build_batch_validation_prompt(
+    company_name: str,
+    company_domain: str,
+    leads: List[Dict[str, Any]]
+) -> str:
+    """Build one LLM validation prompt covering several leads of the same company."""
+    results = '\n'.join(
+        f"""{i}. Name: {lead.get('person_name', '')}
+   Title: {lead.get('person_title', '')}
+   LinkedIn URL: {lead.get('linkedin_url', '')}
+   Source Title: {lead.get('source_title', '')}"""
+        for i, lead in enumerate(leads, 1)
+    )
+    return f"""{_BATCH_PROMPT_HEAD}
 
-Respond with JSON only:
-{{"valid": true/false, "reason": "brief explanation"}}"""
+TARGET COMPANY: {company_name}
+TARGET COMPANY DOMAIN: {company_domain}
+
+SEARCH RESULTS:
+{results}
+
+{_BATCH_PROMPT_TAIL}"""
+
+
+def is_high_confidence_lead(lead: Dict[str, Any], company_name_lower: str) -> bool:
+    """
+    Check if a lead is unambiguous enough to accept without LLM validation.
+
+    True when the parsed title is a current C-level title and the source title
+    ("Name | Title at Company") names exactly the target company as employer.
+    """
+    person_title = lead.get('person_title') or ''
+    if not HIGH_CONFIDENCE_TITLE_RE.search(person_title) or _PAST_ROLE_RE.search(person_title):
+        return False
+
+    source_title = lead.get('source_title') or ''
+    employer = source_title.partition(' | ')[2].rpartition(' at ')[2]
+    return bool(company_name_lower) and employer.strip().lower() == company_name_lower
 
 
 def validate_leads_with_llm(
@@ -105,6 +341,9 @@ def validate_leads_with_llm(
     """
     Validate leads using LLM to filter out false positives.
 
+    Uncached leads are sent in batches of LLM_VALIDATION_BATCH_SIZE per
+    OpenRouter call; batches of one company run concurrently.
+
     Args:
         leads: List of lead dictionaries from Exa search
         company: Company dictionary for context
@@ -118,57 +357,186 @@ def validate_leads_with_llm(
     if not leads:
         return leads
 
-    validated = []
+    keys = [_verdict_key(lead, company) for lead in leads]
+    verdicts = [_cached_verdict(key) for key in keys]
+    pending = [i for i, verdict in enumerate(verdicts) if verdict is None]
+
+    if pending:
+        batches = [
+            pending[i:i + LLM_VALIDATION_BATCH_SIZE]
+            for i in range(0, len(pending), LLM_VALIDATION_BATCH_SIZE)
+        ]
+
+        def validate_batch(batch: List[int]) -> List[bool]:
+            return _validate_batch_with_llm([leads[i] for i in batch], [keys[i] for i in batch], company)
+
+        # The semaphore in _post_llm caps requests across all search workers
+        with ThreadPoolExecutor(max_workers=min(len(batches), LLM_VALIDATION_WORKERS)) as executor:
+            for batch, batch_verdicts in zip(batches, executor.map(validate_batch, batches)):
+                for i, verdict in zip(batch, batch_verdicts):
+                    verdicts[i] = verdict
+
+    return [lead for lead, verdict in zip(leads, verdicts) if verdict]
+
+
+def _verdict_key(lead: Dict[str, Any], company: Dict[str, Any]) -> Tuple[str, ...]:
+    """Verdict cache key: exactly the values the validation prompt is built from."""
+    return (
+        company.get('company_name', ''),
+        company.get('company_domain', ''),
+        lead.get('person_name', ''),
+        lead.get('person_title', ''),
+        lead.get('linkedin_url', ''),
+        lead.get('source_title', '')
+    )
+
+
+def _cached_verdict(key: Tuple[str, ...]) -> Optional[bool]:
+    """Cached LLM verdict for a lead, or None if not cached."""
+    with _verdict_cache_lock:
+        verdict = _verdict_cache.get(key)
+        if verdict is not None:
+            _verdict_cache.move_to_end(key)
+        return verdict
+
+
+def _cache_verdict(key: Tuple[str, ...], verdict: bool):
+    """Store an LLM verdict, evicting the least recently used beyond LLM_VERDICT_CACHE_SIZE."""
+    with _verdict_cache_lock:
+        _verdict_cache[key] = verdict
+        _verdict_cache.move_to_end(key)
+        if len(_verdict_cache) > LLM_VERDICT_CACHE_SIZE:
+            _verdict_cache.popitem(last=False)
 
-    for lead in leads:
-        prompt = LLM_VALIDATION_PROMPT.format(
-            company_name=company.get('company_name', ''),
-            company_domain=company.get('company_domain', ''),
-            person_name=lead.get('person_name', ''),
-            person_title=lead.get('person_title', ''),
-            linkedin_url=lead.get('linkedin_url', ''),
-            source_title=lead.get('source_title', '')
-        )
 
+def _validate_batch_with_llm(
+    leads: List[Dict[str, Any]],
+    keys: List[Tuple[str, ...]],
+    company: Dict[str, Any]
+) -> List[bool]:
+    """Verdicts for several leads of one company, from a single LLM call where possible."""
+    if len(leads) > 1:
         try:
-            response = requests.post(
-                f'{OPENROUTER_BASE_URL}/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {OPENROUTER_API_KEY}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': LLM_MODEL,
-                    'messages': [{'role': 'user', 'content': prompt}],
-                    'temperature': 0,
-                    'max_tokens': 100
-                },
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                content = result.get('choices', [{}])[0].get('message', {}).get('content', '')
-
-                # Parse JSON response
-                try:
-                    # Handle markdown code blocks
-                    if '```json' in content:
-                        content = content.split('```json')[1].split('```')[0]
-                    elif '```' in content:
-                        content = content.split('```')[1].split('```')[0]
-
-                    validation = json.loads(content.strip())
-                    if validation.get('valid', False):
-                        validated.append(lead)
-                except json.JSONDecodeError:
-                    # If we can't parse, include the lead (fail open)
-                    validated.append(lead)
+            verdicts = _llm_batch_verdicts(leads, company)
+        except requests.HTTPError:
+            # Non-200 reply: drop the leads
+            return [False] * len(leads)
         except Exception:
-            # On error, include the lead (fail open)
-            validated.append(lead)
+            # On error, include the leads (fail open)
+            return [True] * len(leads)
+
+        if verdicts is not None:
+            for key, verdict in zip(keys, verdicts):
+                _cache_verdict(key, verdict)
+            return verdicts
 
-    return validated
+    # Single lead, or the batch reply didn't line up with the leads
+    return [_validate_lead_with_llm(lead, key) for lead, key in zip(leads, keys)]
+
+
+def _validate_lead_with_llm(lead: Dict[str, Any], key: Tuple[str, ...]) -> bool:
+    """Ask the LLM whether a single lead is valid (True on errors or unparseable replies)."""
+    try:
+        verdict = _llm_verdict(*key)
+    except requests.HTTPError:
+        # Non-200 reply: drop the lead
+        return False
+    except Exception:
+        # On error, include the lead (fail open)
+        return True
+
+    if verdict is None:
+        # If we can't parse, include the lead (fail open); not cached
+        return True
+
+    _cache_verdict(key, verdict)
+    return verdict
+
+
+def _post_llm(prompt: str, max_tokens: int) -> str:
+    """Send a prompt to OpenRouter and return the reply text (HTTPError on non-200)."""
+    with _llm_semaphore:
+        response = _openrouter_session.post(
+            f'{OPENROUTER_BASE_URL}/chat/completions',
+            data=json_dumps({
+                'model': LLM_MODEL,
+                'messages': [{'role': 'user', 'content': prompt}],
+                'temperature': 0,
+                'max_tokens': max_tokens
+            }),
+            timeout=10
+        )
+
+    if response.status_code != 200:
+        raise requests.HTTPError(f'OpenRouter returned {response.status_code}', response=response)
+
+    result = json_loads(response.content)
+    return result.get('choices', [{}])[0].get('message', {}).get('content', '')
+
+
+def _strip_code_fence(content: str) -> str:
+    """Handle markdown code blocks around a JSON reply."""
+    if '```json' in content:
+        content = content.split('```json')[1].split('```')[0]
+    elif '```' in content:
+        content = content.split('```')[1].split('```')[0]
+    return content.strip()
+
+
+def _llm_verdict(
+    company_name: str,
+    company_domain: str,
+    person_name: str,
+    person_title: str,
+    linkedin_url: str,
+    source_title: str
+) -> Optional[bool]:
+    """LLM verdict for one lead (None if the reply can't be parsed)."""
+    content = _post_llm(
+        build_validation_prompt(
+            company_name, company_domain, person_name, person_title, linkedin_url, source_title
+        ),
+        max_tokens=100
+    )
+
+    # Fast path: the verdict is the only field we need, so read it straight
+    # from the text (also works inside code fences or around a truncated reason)
+    verdict = _LLM_VERDICT_RE.search(content)
+    if verdict:
+        return verdict.group(1) == 'true'
+
+    # Parse JSON response
+    try:
+        validation = json.loads(_strip_code_fence(content))
+        return bool(validation.get('valid', False))
+    except (json.JSONDecodeError, AttributeError):
+        return None
+
+
+def _llm_batch_verdicts(
+    leads: List[Dict[str, Any]],
+    company: Dict[str, Any]
+) -> Optional[List[bool]]:
+    """LLM verdicts for several leads in one call (None if the reply doesn't match the leads)."""
+    content = _post_llm(
+        build_batch_validation_prompt(
+            company.get('company_name', ''),
+            company.get('company_domain', ''),
+            leads
+        ),
+        max_tokens=LLM_BATCH_TOKENS_PER_LEAD * len(leads)
+    )
+
+    try:
+        validations = json.loads(_strip_code_fence(content))
+    except json.JSONDecodeError:
+        return None
+
+    if not isinstance(validations, list) or len(validations) != len(leads):
+        return None
+    if not all(isinstance(v, dict) and isinstance(v.get('valid'), bool) for v in validations):
+        return None
+    return [v['valid'] for v in validations]
 
 
 def search_decision_makers(
@@ -195,16 +563,18 @@ def search_decision_makers(
 
     all_decision_makers = []
     all_errors = []
+    error_logs = []  # log_error() rows, written in one transaction after the search
     results_lock = threading.Lock()
     progress = SearchProgressCounter(len(companies))
 
+    # One limiter shared by all workers: paces actual Exa calls only (cache
+    # hits skip it), with a burst of one call per worker at startup
+    exa_bucket = TokenBucket(rate=1 / EXA_API_DELAY, capacity=EXA_WORKERS) if EXA_API_DELAY > 0 else None
+
     print(f'Searching for decision makers at {len(companies)} companies using {EXA_WORKERS} workers...')
 
     def search_single_company(company: Dict[str, Any], index: int) -> None:
         """Search for decision makers at a single company (runs in thread pool)."""
-        # Each thread gets its own Exa client
-        exa = Exa(api_key=EXA_API_KEY)
-
         domain = company.get('company_domain')
         company_name = company.get('company_name')
 
@@ -214,33 +584,54 @@ def search_decision_makers(
 
         try:
             # Search for C-level executives and founders only
-            query = f'(CTO OR CEO OR Cofounder OR Founder) at {company_name}'
-
-            # Search with retry logic
-            results = None
-            for attempt in range(MAX_RETRIES):
-                try:
-                    results = exa.search(
-                        query,
-                        category="people",
-                        num_results=EXA_SEARCH_LIMIT
-                    )
-                    break
-                except Exception as e:
-                    if attempt < MAX_RETRIES - 1:
-                        wait_time = RETRY_BACKOFF_BASE ** (attempt + 1)
-                        time.sleep(wait_time)
-                    else:
-                        raise
+            query = EXA_PEOPLE_QUERY_PREFIX + str(company_name)
+
+            # Companies repeat across runs; reuse recent results when cached
+            search_results = _cached_people_search(query)
+
+            if search_results is None:
+                # Search with retry logic
+                results = None
+                for attempt in range(MAX_RETRIES):
+                    if exa_bucket:
+                        exa_bucket.acquire()
+                    try:
+                        results = _get_exa_client().search(
+                            query,
+                            category="people",
+                            num_results=EXA_SEARCH_LIMIT
+                        )
+                        if exa_bucket:
+                            exa_bucket.relax()
+                        break
+                    except Exception as e:
+                        if exa_bucket and _is_rate_limit_error(e):
+                            exa_bucket.throttle()
+                        if attempt < MAX_RETRIES - 1:
+                            wait_time = RETRY_BACKOFF_BASE ** (attempt + 1)
+                            time.sleep(wait_time)
+                        else:
+                            raise
+
+                search_results = (results.results if results else None) or []
+                _store_people_search(query, search_results)
 
             found_people = []
-            if results and results.results:
-                found_people = parse_people_search_results(results.results, company)
+            if search_results:
+                found_people = parse_people_search_results(search_results, company)
 
                 if found_people:
-                    # Validate with LLM before adding (if enabled)
+                    # Validate with LLM before adding (if enabled); clear-cut
+                    # C-level matches at the exact company don't need it
                     if LLM_VALIDATION_ENABLED and OPENROUTER_API_KEY:
-                        found_people = validate_leads_with_llm(found_people, company)
+                        company_name_lower = (company_name or '').lower()
+                        auto_accept, needs_llm = [], []
+                        for person in found_people:
+                            if is_high_confidence_lead(person, company_name_lower):
+                                auto_accept.append(person)
+                            else:
+                                needs_llm.append(person)
+                        found_people = auto_accept + validate_leads_with_llm(needs_llm, company)
 
             # Thread-safe append results
             with results_lock:
@@ -249,13 +640,10 @@ def search_decision_makers(
 
             count = progress.increment(len(found_people))
 
-            # Progress logging every 20 companies
+            # Progress logging every 20 companies (count is this company's own
+            # completion number, so each milestone is printed exactly once)
             if count % 20 == 0 or count == len(companies):
-                completed, with_results, total_people = progress.get_stats()
-                print(f'  Progress: {completed}/{len(companies)} companies searched, {total_people} people found')
-
-            # Small delay to avoid rate limiting
-            time.sleep(EXA_API_DELAY)
+                print(f'  Progress: {count}/{len(companies)} companies searched, {progress.people_found} people found')
 
         except Exception as e:
             with results_lock:
@@ -264,24 +652,19 @@ def search_decision_makers(
                     'domain': domain,
                     'error': str(e)
                 })
+                error_logs.append((
+                    'search',
+                    'API_ERROR',
+                    f'Error searching {domain}: {str(e)}',
+                    {'company': company_name, 'domain': domain}
+                ))
             progress.increment(0)
-            pipeline_run.log_error(
-                'search',
-                'API_ERROR',
-                f'Error searching {domain}: {str(e)}',
-                {'company': company_name, 'domain': domain}
-            )
-
-    # Process companies in parallel
-    with ThreadPoolExecutor(max_workers=EXA_WORKERS) as executor:
-        futures = {executor.submit(search_single_company, company, i): company
-                   for i, company in enumerate(companies)}
 
-        for future in as_completed(futures):
-            try:
-                future.result()
-            except Exception:
-                pass  # Errors already tracked in search_single_company
+    # Process companies in parallel (search_single_company records its own errors,
+    # so results are only drained, in submission order)
+    with ThreadPoolExecutor(max_workers=EXA_WORKERS) as executor:
+        for _ in executor.map(search_single_company, companies, range(len(companies))):
+            pass
 
     completed, with_results, total_people = progress.get_stats()
     print(f'\nSearch complete:')
@@ -290,12 +673,14 @@ def search_decision_makers(
     print(f'  Decision makers found: {len(all_decision_makers)}')
     print(f'  Errors: {len(all_errors)}')
 
-    pipeline_run.complete_stage(
-        stage_id,
-        output_count=len(all_decision_makers),
-        error_count=len(all_errors),
-        error_details=all_errors if all_errors else None
-    )
+    with pipeline_run.transaction():
+        pipeline_run.log_errors_bulk(error_logs)
+        pipeline_run.complete_stage(
+            stage_id,
+            output_count=len(all_decision_makers),
+            error_count=len(all_errors),
+            error_details=all_errors if all_errors else None
+        )
 
     return all_decision_makers
 
@@ -322,53 +707,50 @@ def parse_people_search_results(
         List of decision maker dictionaries
     """
     found_people = []
-    seen_linkedin_urls = set()
+    seen_slugs = set()
     company_name_lower = company.get('company_name', '').lower()
+    company_fields = {field: company.get(field) for field in LEAD_COMPANY_FIELDS}
+    prefix_len = len(LINKEDIN_PROFILE_PREFIX)
 
     for result in results:
-        url = getattr(result, 'url', '')
-        title = getattr(result, 'title', '')
-        author = getattr(result, 'author', '')
+        url, title, author = _result_fields(result)
 
         # Only process LinkedIn URLs
-        if 'linkedin.com/in/' not in url:
+        prefix_pos = url.find(LINKEDIN_PROFILE_PREFIX)
+        if prefix_pos < 0:
             continue
 
-        # Extract LinkedIn URL
-        linkedin_match = LINKEDIN_URL_PATTERN.search(url)
-        if not linkedin_match:
+        # Check if this person is at the right company (one lowercase + substring
+        # scan, done before the regex, dedupe and title parsing it can rule out)
+        if company_name_lower and company_name_lower not in title.lower():
+            # Person not at this company, skip
             continue
 
-        linkedin_url = f"https://www.linkedin.com/in/{linkedin_match.group(1)}"
+        # Extract the profile slug
+        slug_match = _LINKEDIN_SLUG_RE.match(url, prefix_pos + prefix_len)
+        if not slug_match:
+            continue
+        slug = slug_match.group()
 
         # Skip duplicates
-        if linkedin_url in seen_linkedin_urls:
+        if slug in seen_slugs:
             continue
-        seen_linkedin_urls.add(linkedin_url)
+        seen_slugs.add(slug)
 
         # Parse title format: "Name | Title at Company"
         person_name = author if author else None
         person_title = None
 
-        if ' | ' in title:
-            parts = title.split(' | ', 1)
+        # partition() finds each separator in one scan (whole string if absent)
+        name_part, sep, title_part = title.partition(' | ')
+        if sep:
             if not person_name:
-                person_name = parts[0].strip()
-            if len(parts) > 1:
-                title_part = parts[1]
-                if ' at ' in title_part:
-                    person_title = title_part.split(' at ')[0].strip()
-                else:
-                    person_title = title_part.strip()
-
-        # Check if this person is at the right company
-        title_lower = title.lower()
-        if company_name_lower and company_name_lower not in title_lower:
-            # Person not at this company, skip
-            continue
+                person_name = name_part.strip()
+            person_title = title_part.partition(' at ')[0].strip()
 
-        # Check if this is a decision maker title
-        if not is_decision_maker_title(title) and not is_decision_maker_title(person_title or ''):
+        # Check if this is a decision maker title (person_title is cut from title
+        # at spaces, so it can only match where title already does)
+        if not is_decision_maker_title(title):
             continue
 
         # Skip if no name
@@ -379,18 +761,13 @@ def parse_people_search_results(
 
         found_people.append({
             # Company info
-            'company_name': company.get('company_name'),
-            'company_domain': company.get('company_domain'),
-            'company_website': company.get('company_website'),
-            'job_title': company.get('job_title'),
-            'employee_count': company.get('employee_count'),
-            'location': company.get('location'),
+            **company_fields,
             # Person info
             'person_name': person_name,
             'person_first_name': first_name,
             'person_last_name': last_name,
             'person_title': person_title or extract_title_from_text(title),
-            'linkedin_url': linkedin_url,
+            'linkedin_url': f'https://www.linkedin.com/in/{slug}',
             'source_url': url,
             'source_title': title,
         })
@@ -404,10 +781,10 @@ def is_decision_maker_title(text: str) -> bool:
         return False
 
     text_upper = text.upper()
-    for pattern in TITLE_PATTERNS:
-        if re.search(pattern, text_upper, re.IGNORECASE):
-            return True
-    return False
+    if not any(keyword in text_upper for keyword in _TITLE_KEYWORDS):
+        return False
+
+    return TITLE_RE.search(text) is not None
 
 
 def extract_person_info(title: str, url: str) -> Tuple[Optional[str], Optional[str]]:
@@ -425,19 +802,16 @@ def extract_person_info(title: str, url: str) -> Tuple[Optional[str], Optional[s
     person_title = None
 
     # Common LinkedIn title format: "Name - Title at Company"
-    if ' - ' in title:
-        parts = title.split(' - ', 1)
-        person_name = parts[0].strip()
-
-        if len(parts) > 1:
-            # Extract title (before "at Company")
-            title_part = parts[1]
-            if ' at ' in title_part:
-                person_title = title_part.split(' at ')[0].strip()
-            elif '|' in title_part:
-                person_title = title_part.split('|')[0].strip()
-            else:
-                person_title = title_part.strip()
+    name_part, sep, title_part = title.partition(' - ')
+    if sep:
+        person_name = name_part.strip()
+
+        # Extract title (before "at Company", else before any "|")
+        before_at, at_sep, _ = title_part.partition(' at ')
+        if at_sep:
+            person_title = before_at.strip()
+        else:
+            person_title = title_part.partition('|')[0].strip()
 
     # Try extracting from URL if it's LinkedIn
     if not person_name and 'linkedin.com/in/' in url:
@@ -445,7 +819,7 @@ def extract_person_info(title: str, url: str) -> Tuple[Optional[str], Optional[s
         if match:
             # Convert URL slug to name (e.g., "john-doe" -> "John Doe")
             slug = match.group(1)
-            name_parts = slug.replace('-', ' ').replace('_', ' ').split()
+            name_parts = slug.translate(_SLUG_TRANS).split()
             person_name = ' '.join(word.capitalize() for word in name_parts if not word.isdigit())
 
     return person_name, person_title
@@ -453,8 +827,8 @@ def extract_person_info(title: str, url: str) -> Tuple[Optional[str], Optional[s
 
 def extract_title_from_text(text: str) -> str:
     """Extract a clean title from text."""
-    for pattern in TITLE_PATTERNS:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in _TITLE_PATTERN_RES:
+        match = pattern.search(text)
         if match:
             return match.group(0)
     return 'Engineering Leader'
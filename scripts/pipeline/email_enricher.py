@@ -3,8 +3,12 @@ Email Enricher module using Icypeas API.
 Uses bulk search for faster enrichment (single API call for all leads).
 """
 
+import hashlib
+import sys
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
@@ -14,12 +18,82 @@ from .config import (
     ICYPEAS_USER_ID,
     ICYPEAS_POLL_INTERVAL,
     ICYPEAS_POLL_TIMEOUT,
+    ICYPEAS_POLL_MAX_INTERVAL,
     ICYPEAS_BATCH_SIZE,
+    ICYPEAS_MAX_CONCURRENT_BATCHES,
+    EMAIL_CACHE_TTL_HOURS,
     MAX_RETRIES,
     RETRY_BACKOFF_BASE,
-    MAX_LEADS_PER_RUN
+    MAX_LEADS_PER_RUN,
+    ENRICHMENT_WORKERS
 )
-from .db_logger import PipelineRun
+from .db_logger import PipelineRun, get_email_cache, set_email_cache
+from .json_codec import json_dumps, json_dumps_text, json_loads
+
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive Icypeas session (polling reuses one TCP/TLS connection)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=ENRICHMENT_WORKERS, pool_maxsize=ENRICHMENT_WORKERS * 2, max_retries=0)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({
+        'Authorization': ICYPEAS_API_KEY,
+        'Content-Type': 'application/json'
+    })
+    return session
+
+
+_icypeas_session = _create_session()
+
+# Shared worker pools, so threads stay warm across batches and runs. Batches
+# and page prefetches get separate pools because a batch waits on its prefetch.
+# Each running batch has at most one prefetch outstanding.
+_batch_executor = ThreadPoolExecutor(max_workers=max(ICYPEAS_MAX_CONCURRENT_BATCHES, 1), thread_name_prefix='icypeas-batch')
+_page_executor = ThreadPoolExecutor(max_workers=max(ICYPEAS_MAX_CONCURRENT_BATCHES, 1), thread_name_prefix='icypeas-page')
+
+# First wait (seconds) when polling a single email search; doubles on each poll
+SINGLE_POLL_INITIAL_DELAY = 0.5
+
+# Single-search statuses after which polling can stop
+SINGLE_SEARCH_TERMINAL_STATUSES = frozenset({'DEBITED', 'FOUND', 'NO_RESULT', 'ERROR'})
+
+
+def _norm(value: str) -> str:
+    """Normalize a name/domain for lookup keys (interned: domains repeat across leads)."""
+    return sys.intern(value.casefold()) if value else ''
+
+
+def _email_cache_key(key: Tuple[str, str, str]) -> str:
+    """Cache key for a normalized (firstname, lastname, domain) lookup."""
+    return hashlib.sha1('|'.join(key).encode('utf-8')).hexdigest()
+
+
+def _cached_email_results(
+    keys: List[Tuple[str, str, str]]
+) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
+    """Fresh cached results for the given lookup keys (only keys found in the cache)."""
+    if EMAIL_CACHE_TTL_HOURS <= 0 or not keys:
+        return {}
+    try:
+        hashed = {_email_cache_key(key): key for key in keys}
+        payloads = get_email_cache(list(hashed), EMAIL_CACHE_TTL_HOURS * 3600)
+        return {hashed[h]: json_loads(payload) for h, payload in payloads.items()}
+    except Exception:
+        return {}  # Cache is best-effort; fall back to a live search
+
+
+def _store_email_results(results: Dict[Tuple[str, str, str], Dict[str, Any]]):
+    """Cache found emails so later runs skip the lookup."""
+    if EMAIL_CACHE_TTL_HOURS <= 0 or not results:
+        return
+    try:
+        set_email_cache([
+            (_email_cache_key(key), json_dumps_text(result))
+            for key, result in results.items()
+        ])
+    except Exception:
+        pass  # Don't fail enrichment if the cache write fails
 
 
 def enrich_with_emails(
@@ -47,6 +121,7 @@ def enrich_with_emails(
 
     # Prepare leads for bulk search
     valid_leads = []
+    valid_keys = []  # Result lookup key per valid lead, computed once here
     skipped_leads = []
 
     for lead in leads:
@@ -56,6 +131,7 @@ def enrich_with_emails(
 
         if domain and (first_name or last_name):
             valid_leads.append(lead)
+            valid_keys.append((_norm(first_name), _norm(last_name), _norm(domain)))
         else:
             # Skip leads missing required data
             lead['email'] = None
@@ -73,7 +149,7 @@ def enrich_with_emails(
 
     # Run bulk search
     try:
-        email_results = bulk_email_search(valid_leads, pipeline_run)
+        email_results = bulk_email_search(valid_leads, pipeline_run, valid_keys)
         errors = []
     except Exception as e:
         print(f'Bulk search failed: {e}')
@@ -83,14 +159,7 @@ def enrich_with_emails(
 
     # Match results back to leads
     success_count = 0
-    for lead in valid_leads:
-        first_name = lead.get('person_first_name', '')
-        last_name = lead.get('person_last_name', '')
-        domain = lead.get('company_domain', '')
-
-        # Create lookup key (lowercase for matching)
-        key = (first_name.lower(), last_name.lower(), domain.lower())
-
+    for lead, key in zip(valid_leads, valid_keys):
         result = email_results.get(key)
         if result:
             lead['email'] = result.get('email')
@@ -106,7 +175,7 @@ def enrich_with_emails(
     if success_count == 0 and email_results:
         print(f'  Debug: Got {len(email_results)} results but no matches found')
         print(f'  Sample result keys: {list(email_results.keys())[:3]}')
-        print(f'  Sample lead key: {[(l.get("person_first_name", "").lower(), l.get("person_last_name", "").lower(), l.get("company_domain", "").lower()) for l in valid_leads[:1]]}')
+        print(f'  Sample lead key: {valid_keys[:1]}')
 
     pipeline_run.complete_stage(
         stage_id,
@@ -120,7 +189,8 @@ def enrich_with_emails(
 
 def bulk_email_search(
     leads: List[Dict[str, Any]],
-    pipeline_run: PipelineRun
+    pipeline_run: PipelineRun,
+    keys: Optional[List[Tuple[str, str, str]]] = None
 ) -> Dict[Tuple[str, str, str], Dict[str, Any]]:
     """
     Perform bulk email search using Icypeas bulk API.
@@ -128,6 +198,7 @@ def bulk_email_search(
     Args:
         leads: List of lead dictionaries
         pipeline_run: PipelineRun instance for logging
+        keys: Precomputed (firstname, lastname, domain) lowercased key per lead, if the caller has them
 
     Returns:
         Dictionary mapping (firstname, lastname, domain) -> {email, certainty}
@@ -140,28 +211,49 @@ def bulk_email_search(
     # Prepare bulk data: [[firstname, lastname, domain], ...]
     bulk_data = []
     lead_keys = []  # Track keys for result matching
+    seen = set()
 
-    for lead in leads:
+    for i, lead in enumerate(leads):
         first_name = lead.get('person_first_name', '')
         last_name = lead.get('person_last_name', '')
         domain = lead.get('company_domain', '')
 
+        # Leads sharing a name + domain are looked up once; results are keyed by
+        # the same tuple, so every duplicate picks up the shared result
+        key = keys[i] if keys is not None else (_norm(first_name), _norm(last_name), _norm(domain))
+        if key in seen:
+            continue
+        seen.add(key)
+
         bulk_data.append([first_name, last_name, domain])
-        lead_keys.append((first_name.lower(), last_name.lower(), domain.lower()))
+        lead_keys.append(key)
+
+    if len(lead_keys) < len(leads):
+        print(f'  Skipped {len(leads) - len(lead_keys)} duplicate name + domain lookups')
+
+    # Emails found by earlier runs are reused; only the rest are submitted
+    all_results = _cached_email_results(lead_keys)
+    if all_results:
+        print(f'  {len(all_results)} leads resolved from the email cache')
+        uncached = [
+            (data, key) for data, key in zip(bulk_data, lead_keys)
+            if key not in all_results
+        ]
+        bulk_data = [data for data, _ in uncached]
+        lead_keys = [key for _, key in uncached]
 
     # Split into batches if needed (max 5000 per bulk search)
-    all_results = {}
     batches = [bulk_data[i:i + ICYPEAS_BATCH_SIZE] for i in range(0, len(bulk_data), ICYPEAS_BATCH_SIZE)]
     key_batches = [lead_keys[i:i + ICYPEAS_BATCH_SIZE] for i in range(0, len(lead_keys), ICYPEAS_BATCH_SIZE)]
 
-    for batch_num, (batch, keys) in enumerate(zip(batches, key_batches), 1):
+    def run_batch(batch_num: int, batch: List[List[str]], keys: List[Tuple[str, str, str]]) -> Dict:
         print(f'  Submitting bulk search batch {batch_num}/{len(batches)} ({len(batch)} leads)...')
 
         # Submit bulk search
-        file_id = submit_bulk_search(batch, headers)
+        file_id = submit_bulk_search(batch, headers, batch_num)
         if not file_id:
             print(f'    Failed to submit batch {batch_num}')
-            continue
+            return {}
 
         print(f'    Bulk search submitted, file ID: {file_id}')
 
@@ -174,48 +266,64 @@ def bulk_email_search(
         # Fetch results (try regardless of poll status, as results may be available)
         print(f'    Fetching results...')
         batch_results = fetch_bulk_results(file_id, headers, keys)
-        
+
         if batch_results:
-            all_results.update(batch_results)
             print(f'    Batch {batch_num} got {len(batch_results)} results despite timeout')
         elif not completed:
             print(f'    Batch {batch_num}: No results found')
-            continue
+            return {}
 
         print(f'    Batch {batch_num} complete: {len(batch_results)} emails found')
+        return batch_results
+
+    # Each batch is an independent Icypeas job, so several are submitted and polled at once
+    batch_args = list(zip(range(1, len(batches) + 1), batches, key_batches))
+    if len(batch_args) > 1 and ICYPEAS_MAX_CONCURRENT_BATCHES > 1:
+        batch_results_list = list(_batch_executor.map(lambda args: run_batch(*args), batch_args))
+    else:
+        batch_results_list = [run_batch(*args) for args in batch_args]
+
+    for batch_results in batch_results_list:
+        all_results.update(batch_results)
+        _store_email_results(batch_results)
 
     return all_results
 
 
-def submit_bulk_search(data: List[List[str]], headers: Dict[str, str]) -> Optional[str]:
+def submit_bulk_search(
+    data: List[List[str]],
+    headers: Dict[str, str],
+    batch_num: Optional[int] = None
+) -> Optional[str]:
     """
     Submit a bulk email search request.
 
     Args:
         data: List of [firstname, lastname, domain] arrays
         headers: Request headers with auth
+        batch_num: Batch number, appended to the file name (batches may be submitted in the same second)
 
     Returns:
         File ID for the bulk search, or None on failure
     """
     payload = {
         'user': ICYPEAS_USER_ID,
-        'name': f'pipeline_bulk_{datetime.now().strftime("%Y%m%d_%H%M%S")}',
+        'name': f'pipeline_bulk_{datetime.now().strftime("%Y%m%d_%H%M%S")}' + (f'_b{batch_num}' if batch_num else ''),
         'task': 'email-search',
         'data': data
     }
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(
+            response = _icypeas_session.post(
                 f'{ICYPEAS_BASE_URL}/bulk-search',
                 headers=headers,
-                json=payload,
+                data=json_dumps(payload),
                 timeout=60
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if result.get('success'):
                     return result.get('file')
                 else:
@@ -265,21 +373,25 @@ def poll_bulk_completion(
     poll_interval = ICYPEAS_POLL_INTERVAL
     last_progress = 0
     poll_count = 0
+    # Last progress sample, for estimating the processing rate
+    rate_time = start_time
+    rate_progress = 0
 
     while time.time() - start_time < ICYPEAS_POLL_TIMEOUT:
         try:
             poll_count += 1
-            response = requests.post(
+            progress = None
+            response = _icypeas_session.post(
                 f'{ICYPEAS_BASE_URL}/search-files/read',
                 headers=headers,
-                json={'file': file_id},
+                data=json_dumps({'file': file_id}),
                 timeout=30
             )
 
             elapsed = int(time.time() - start_time)
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get('success'):
                     # Try new format first: files array
@@ -322,9 +434,15 @@ def poll_bulk_completion(
             else:
                 print(f'      Poll #{poll_count} returned {response.status_code} after {elapsed}s: {response.text[:150]}')
 
+            if not isinstance(progress, (int, float)):
+                progress = None  # Missing or unexpected format: no rate estimate
+            poll_interval = next_bulk_poll_interval(
+                poll_interval, progress, total_items, rate_time, rate_progress
+            )
+            if progress is not None and progress > rate_progress:
+                rate_time, rate_progress = time.time(), progress
+
             time.sleep(poll_interval)
-            # Gradual backoff: 5s -> 7s -> 10s -> 15s -> 20s -> 30s -> 60s (capped)
-            poll_interval = min(poll_interval * 1.4, 60)
 
         except Exception as e:
             elapsed = int(time.time() - start_time)
@@ -336,6 +454,54 @@ def poll_bulk_completion(
     return False
 
 
+def next_bulk_poll_interval(
+    poll_interval: float,
+    progress: Optional[int],
+    total_items: int,
+    rate_time: float,
+    rate_progress: int
+) -> float:
+    """
+    Wait before the next bulk status poll.
+
+    Once progress is moving, sleeps until just before the estimated finish
+    (remaining items / observed rate), so a long job costs a few polls instead
+    of dozens. Otherwise falls back to a gradual 1.4x backoff. Always clamped
+    to [ICYPEAS_POLL_INTERVAL, ICYPEAS_POLL_MAX_INTERVAL].
+    """
+    elapsed = time.time() - rate_time
+    if progress is not None and progress > rate_progress and elapsed > 0:
+        rate = (progress - rate_progress) / elapsed  # Items per second
+        next_interval = max(total_items - progress, 0) / rate * 0.9
+    else:
+        next_interval = poll_interval * 1.4
+    return min(max(next_interval, ICYPEAS_POLL_INTERVAL), ICYPEAS_POLL_MAX_INTERVAL)
+
+
+def _request_results_page(
+    file_id: str,
+    headers: Dict[str, str],
+    sort_value: Optional[str]
+) -> requests.Response:
+    """Request one page (up to 100 items) of bulk results, after the given cursor."""
+    payload = {
+        'mode': 'bulk',
+        'file': file_id,
+        'limit': 100  # Max per request
+    }
+
+    if sort_value:
+        payload['sort'] = sort_value
+        payload['next'] = True
+
+    return _icypeas_session.post(
+        f'{ICYPEAS_BASE_URL}/bulk-single-searchs/read',
+        headers=headers,
+        data=json_dumps(payload),
+        timeout=60
+    )
+
+
 def fetch_bulk_results(
     file_id: str,
     headers: Dict[str, str],
@@ -358,32 +524,36 @@ def fetch_bulk_results(
     page = 0
     MAX_PAGES = 100  # Safety limit: 100 pages * 100 items = 10,000 max results
 
+    # Pages are cursor-linked (each needs the previous page's last item), so they
+    # can't be fetched in parallel. Instead the next page is requested as soon as
+    # its cursor is known, while the current page is being processed.
+    next_page = _page_executor.submit(_request_results_page, file_id, headers, sort_value)
+
     while has_more and page < MAX_PAGES:
         try:
-            payload = {
-                'mode': 'bulk',
-                'file': file_id,
-                'limit': 100  # Max per request
-            }
-
-            if sort_value:
-                payload['sort'] = sort_value
-                payload['next'] = True
-
-            response = requests.post(
-                f'{ICYPEAS_BASE_URL}/bulk-single-searchs/read',
-                headers=headers,
-                json=payload,
-                timeout=60
-            )
+            response = next_page.result()
+            next_page = None
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get('success') and result.get('items'):
                     items = result['items']
                     page += 1
-                    
+
+                    # Check for more pages
+                    if len(items) < 100:
+                        has_more = False
+                    else:
+                        # Get sort value for next page
+                        last_item = items[-1]
+                        sort_value = last_item.get('createdAt') or last_item.get('_id')
+                        if not sort_value:
+                            has_more = False
+
+                    if has_more and page < MAX_PAGES:
+                        next_page = _page_executor.submit(_request_results_page, file_id, headers, sort_value)
+
                     if page == 1:
                         print(f'      Fetching results: got {len(items)} items on page 1')
                         if items:
@@ -393,11 +563,11 @@ def fetch_bulk_results(
                         # Use order field to match back to original lead
                         # order field tells us which row in the data array this result is for
                         order = item.get('order', -1)
-                        
+
                         if order >= 0 and order < len(lead_keys):
                             # Get the original lead key by position
                             key = lead_keys[order]
-                            
+
                             # Get email results from the results object
                             results_data = item.get('results', {})
                             emails = results_data.get('emails', [])
@@ -409,22 +579,12 @@ def fetch_bulk_results(
                                     'email': best.get('email'),
                                     'certainty': best.get('certainty')
                                 }
-                            
+
                             if page == 1 and len(results) <= 3:
                                 # Debug: show what we're extracting
                                 found_name = item.get('results', {}).get('fullname', 'N/A')
                                 print(f'        Result #{order}: key={key}, found_name={found_name}, has_emails={bool(emails)}')
 
-                    # Check for more pages
-                    if len(items) < 100:
-                        has_more = False
-                    else:
-                        # Get sort value for next page
-                        last_item = items[-1]
-                        sort_value = last_item.get('createdAt') or last_item.get('_id')
-                        if not sort_value:
-                            has_more = False
-
                     if page % 5 == 0 or len(items) < 100:
                         print(f'      Fetched {len(results)} results so far (page {page}, got {len(items)} items)...')
 
@@ -435,6 +595,7 @@ def fetch_bulk_results(
 
             elif response.status_code == 429:
                 time.sleep(2)
+                next_page = _page_executor.submit(_request_results_page, file_id, headers, sort_value)
                 continue
 
             else:
@@ -494,15 +655,15 @@ def single_email_search(
 
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.post(
+            response = _icypeas_session.post(
                 f'{ICYPEAS_BASE_URL}/email-search',
                 headers=headers,
-                json=payload,
+                data=json_dumps(payload),
                 timeout=30
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if result.get('success'):
                     item_id = result.get('item', {}).get('_id')
                     if item_id:
@@ -534,19 +695,22 @@ def poll_single_search_result(item_id: str) -> Optional[Dict[str, Any]]:
     }
 
     start_time = time.time()
-    poll_interval = ICYPEAS_POLL_INTERVAL
+    attempt = 0
 
     while time.time() - start_time < ICYPEAS_POLL_TIMEOUT:
+        # Single searches usually finish within a second or two: start with short
+        # waits and back off exponentially up to ICYPEAS_POLL_INTERVAL
+        poll_interval = min(ICYPEAS_POLL_INTERVAL, SINGLE_POLL_INITIAL_DELAY * (2 ** attempt))
         try:
-            response = requests.post(
+            response = _icypeas_session.post(
                 f'{ICYPEAS_BASE_URL}/bulk-single-searchs/read',
                 headers=headers,
-                json={'id': item_id},
+                data=json_dumps({'id': item_id}),
                 timeout=30
             )
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
 
                 if result.get('success') and result.get('items'):
                     items = result['items']
@@ -554,7 +718,7 @@ def poll_single_search_result(item_id: str) -> Optional[Dict[str, Any]]:
                         item = items[0]
                         status = item.get('status')
 
-                        if status in ['DEBITED', 'FOUND', 'NO_RESULT', 'ERROR']:
+                        if status in SINGLE_SEARCH_TERMINAL_STATUSES:
                             results_data = item.get('results', {})
                             emails = results_data.get('emails', [])
 
@@ -567,9 +731,10 @@ def poll_single_search_result(item_id: str) -> Optional[Dict[str, Any]]:
                             return None
 
             time.sleep(poll_interval)
-            poll_interval = min(poll_interval * 1.5, 15)
+            attempt += 1
 
         except Exception:
             time.sleep(poll_interval)
+            attempt = 0  # Transient error: retry on the short schedule
 
     return None
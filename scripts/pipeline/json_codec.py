@@ -0,0 +1,38 @@
+"""
+JSON codec module.
+Uses orjson (C extension, much faster on large nested payloads) when it is
+installed, and falls back to the stdlib json module otherwise.
+"""
+
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return orjson.dumps(obj)
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return orjson.loads(data)
+
+    def json_dumps_text(obj: Any) -> str:
+        """Serialize an object to compact JSON text (for TEXT columns)."""
+        # OPT_NON_STR_KEYS: stringify int/etc. dict keys like the stdlib does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+except ImportError:
+    import json
+
+    def json_dumps(obj: Any) -> bytes:
+        """Serialize an object to compact UTF-8 JSON bytes."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+    def json_loads(data: Union[bytes, str]) -> Any:
+        """Parse JSON from bytes or str."""
+        return json.loads(data)
+
+    def json_dumps_text(obj: Any) -> str:
+        """Serialize an object to compact JSON text (for TEXT columns)."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False)
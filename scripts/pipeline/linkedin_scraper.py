@@ -4,6 +4,7 @@ Scrapes job postings to extract company information.
 """
 
 import time
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 from apify_client import ApifyClient
 
@@ -63,15 +64,17 @@ def scrape_linkedin_jobs(
             started = run.get('startedAt', 'N/A')
             print(f'  {i+1}. [{status}] {run_id} - Started: {started}')
 
-        # Find the most recent SUCCEEDED run (by startedAt timestamp)
-        succeeded_runs = [run for run in runs_list.items if run.get('status') == 'SUCCEEDED']
+        # Find the most recent SUCCEEDED run by startedAt (every listed run has one;
+        # timestamps are ISO format, sortable as strings)
+        latest_run = max(
+            (run for run in runs_list.items if run.get('status') == 'SUCCEEDED'),
+            key=itemgetter('startedAt'),
+            default=None
+        )
 
-        if not succeeded_runs:
+        if latest_run is None:
             raise Exception('No successful runs found. Make sure Apify is scheduled to run before this pipeline.')
 
-        # Sort by startedAt to get the newest (timestamps are ISO format, sortable as strings)
-        latest_run = max(succeeded_runs, key=lambda r: r.get('startedAt', ''))
-
         run_id = latest_run.get('id')
         started_at = latest_run.get('startedAt')
         finished_at = latest_run.get('finishedAt')
@@ -103,11 +106,11 @@ def scrape_linkedin_jobs(
             if len(jobs) % 100 == 0:
                 print(f'  Fetched {len(jobs)} items so far...')
 
-        print(f'\n✅ Successfully fetched {len(jobs)} job postings from dataset')
+        print(f'\n[OK] Successfully fetched {len(jobs)} job postings from dataset')
         if dataset_info and dataset_info.get('itemCount'):
             expected = dataset_info.get('itemCount')
             if len(jobs) != expected:
-                print(f'⚠️  WARNING: Expected {expected} items but got {len(jobs)}')
+                print(f'[WARN] Expected {expected} items but got {len(jobs)}')
 
         pipeline_run.complete_stage(
             stage_id,
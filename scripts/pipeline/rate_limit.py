@@ -0,0 +1,54 @@
+"""
+Rate limiting module.
+Thread-safe token bucket shared by the API clients (Exa search, Prosp retries).
+"""
+
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Token-bucket rate limiter with an adjustable refill rate.
+
+    Allows bursts up to `capacity` requests, then paces callers at `rate`
+    requests per second. throttle() cuts the rate after a 429; relax()
+    grows it back towards the configured ceiling on success.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, min_rate: float = 0.1):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+
+    def acquire(self):
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            # Sleep without the lock, so throttle()/relax() from other workers
+            # take effect immediately; the wait is recomputed on wake-up
+            time.sleep(wait)
+
+    def throttle(self, factor: float = 0.5):
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate * factor)
+
+    def relax(self, factor: float = 1.1):
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate * factor)
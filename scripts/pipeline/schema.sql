@@ -65,10 +65,29 @@ CREATE TABLE IF NOT EXISTS error_logs (
     FOREIGN KEY (run_id) REFERENCES pipeline_runs(id)
 );
 
+-- Exa search result cache (companies repeat across runs)
+CREATE TABLE IF NOT EXISTS exa_query_cache (
+    key TEXT PRIMARY KEY,  -- Hash of query + search parameters
+    created_at REAL NOT NULL,  -- Unix timestamp, for TTL expiry
+    payload TEXT NOT NULL  -- JSON array of {url, title, author}
+);
+
+-- Icypeas email search result cache (same prospects recur across runs)
+CREATE TABLE IF NOT EXISTS email_search_cache (
+    key TEXT PRIMARY KEY,  -- Hash of lowercased (firstname, lastname, domain)
+    created_at REAL NOT NULL,  -- Unix timestamp, for TTL expiry
+    payload TEXT NOT NULL  -- JSON {email, certainty}
+);
+
 -- Indexes for common queries
-CREATE INDEX IF NOT EXISTS idx_stage_metrics_run_id ON stage_metrics(run_id);
-CREATE INDEX IF NOT EXISTS idx_leads_run_id ON leads(run_id);
+-- Composite (run_id, ...) indexes match the per-run lookups, sorts and GROUP BYs,
+-- and also serve plain run_id lookups, so the old single-column ones are dropped
+DROP INDEX IF EXISTS idx_stage_metrics_run_id;
+DROP INDEX IF EXISTS idx_leads_run_id;
+DROP INDEX IF EXISTS idx_error_logs_run_id;
+CREATE INDEX IF NOT EXISTS idx_stage_metrics_run_started ON stage_metrics(run_id, started_at);
+CREATE INDEX IF NOT EXISTS idx_leads_run_status ON leads(run_id, status);
 CREATE INDEX IF NOT EXISTS idx_leads_status ON leads(status);
-CREATE INDEX IF NOT EXISTS idx_error_logs_run_id ON error_logs(run_id);
+CREATE INDEX IF NOT EXISTS idx_error_logs_run_created ON error_logs(run_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_pipeline_runs_status ON pipeline_runs(status);
 CREATE INDEX IF NOT EXISTS idx_pipeline_runs_started_at ON pipeline_runs(started_at);
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Tests for PipelineRun.transaction() (grouped writes with a single COMMIT).
+Runs against a throwaway SQLite database, never data/pipeline.db.
+"""
+
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline import db_logger
+from pipeline.db_logger import PipelineRun
+
+
+def use_temp_database() -> Path:
+    """Point db_logger at a fresh database file and initialize the schema."""
+    db_logger.close_connections()  # Drop connections to any previous database
+    db_logger.DATABASE_PATH = Path(tempfile.mkdtemp()) / 'pipeline_test.db'
+    db_logger.init_database()
+    return db_logger.DATABASE_PATH
+
+
+def count_rows(db_path: Path, table: str, run_id: int) -> int:
+    """Count a run's committed rows through an independent connection."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        return conn.execute(f'SELECT COUNT(*) FROM {table} WHERE run_id = ?', (run_id,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_nested_transaction_commits_once():
+    """Writes in nested blocks become visible together when the outermost block exits."""
+    db_path = use_temp_database()
+    run = PipelineRun(config={'test': True})
+
+    with run.transaction():
+        run.log_error('test', 'VALIDATION', 'outer')
+        with run.transaction():
+            run.bulk_add_leads([{'company_name': 'Acme'}, {'company_name': 'Globex'}])
+        # The inner block joined the outer one: nothing is committed yet
+        assert count_rows(db_path, 'leads', run.run_id) == 0
+        assert count_rows(db_path, 'error_logs', run.run_id) == 0
+
+    assert count_rows(db_path, 'leads', run.run_id) == 2
+    assert count_rows(db_path, 'error_logs', run.run_id) == 1
+
+
+def test_exception_rolls_back_whole_transaction():
+    """An exception escaping the outermost block rolls back every write inside it."""
+    db_path = use_temp_database()
+    run = PipelineRun(config={'test': True})
+
+    try:
+        with run.transaction():
+            run.log_error('test', 'VALIDATION', 'outer')
+            with run.transaction():
+                run.bulk_add_leads([{'company_name': 'Acme'}])
+                raise ValueError('boom')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError('exception was swallowed')
+
+    assert count_rows(db_path, 'leads', run.run_id) == 0
+    assert count_rows(db_path, 'error_logs', run.run_id) == 0
+
+    # The connection is usable again and commits normally afterwards
+    run.log_error('test', 'VALIDATION', 'after rollback')
+    assert count_rows(db_path, 'error_logs', run.run_id) == 1
+
+
+def test_handled_inner_exception_keeps_outer_writes():
+    """An exception caught inside the outer block doesn't undo the joined transaction."""
+    db_path = use_temp_database()
+    run = PipelineRun(config={'test': True})
+
+    with run.transaction():
+        try:
+            with run.transaction():
+                run.bulk_add_leads([{'company_name': 'Acme'}])
+                raise ValueError('handled')
+        except ValueError:
+            pass
+        run.log_error('test', 'VALIDATION', 'outer')
+
+    assert count_rows(db_path, 'leads', run.run_id) == 1
+    assert count_rows(db_path, 'error_logs', run.run_id) == 1
+
+
+TESTS = [
+    test_nested_transaction_commits_once,
+    test_exception_rolls_back_whole_transaction,
+    test_handled_inner_exception_keeps_outer_writes,
+]
+
+
+if __name__ == '__main__':
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f'[PASS] {test.__name__}')
+        except AssertionError as e:
+            failed += 1
+            print(f'[FAIL] {test.__name__}: {e}')
+    db_logger.close_connections()
+    sys.exit(1 if failed else 0)
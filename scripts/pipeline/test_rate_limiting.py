@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Tests for the request-pacing primitives used by the API clients.
+Runs offline: no API keys or network needed.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from pipeline import campaign_pusher
+from pipeline.campaign_pusher import AIMDLimiter, CircuitBreaker
+from pipeline.rate_limit import TokenBucket
+
+
+def fake_response(status_code: int) -> SimpleNamespace:
+    """Stand-in for requests.Response (only status_code is read)."""
+    return SimpleNamespace(status_code=status_code)
+
+
+def test_breaker_opens_on_failure_rate():
+    """A full window at or over the failure threshold opens the breaker."""
+    breaker = CircuitBreaker('test', window=4, failure_threshold=0.5, cooldown=60)
+
+    breaker.record(fake_response(200))
+    breaker.record(fake_response(200))
+    breaker.record(fake_response(429))
+    assert breaker.state == CircuitBreaker.CLOSED  # Window not full yet
+    assert breaker.allow()
+
+    breaker.record(None)  # Request raised
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.cooldown_remaining() > 0
+
+
+def test_breaker_stays_closed_below_threshold():
+    """Occasional failures below the threshold keep the breaker closed."""
+    breaker = CircuitBreaker('test', window=4, failure_threshold=0.5, cooldown=60)
+
+    for status in (200, 200, 200, 503, 200, 200):
+        breaker.record(fake_response(status))
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.cooldown_remaining() == 0
+
+
+def test_breaker_half_open_probe_closes_on_success():
+    """After the cooldown a single probe is let through; success closes the breaker."""
+    breaker = CircuitBreaker('test', window=2, failure_threshold=0.5, cooldown=0.05)
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    time.sleep(0.06)
+    assert breaker.allow()  # The probe
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()  # Only one probe at a time
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_breaker_half_open_probe_reopens_on_failure():
+    """A failed probe opens the breaker again for another cooldown."""
+    breaker = CircuitBreaker('test', window=2, failure_threshold=0.5, cooldown=0.05)
+    breaker.record_failure()
+    breaker.record_failure()
+
+    time.sleep(0.06)
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+
+
+class FakePipelineRun:
+    """Stand-in for PipelineRun: accepts the stage/error logging calls."""
+
+    def start_stage(self, stage, input_count=0):
+        return 1
+
+    def complete_stage(self, stage_id, output_count=0, error_count=0, error_details=None):
+        pass
+
+    def log_error(self, *args, **kwargs):
+        pass
+
+
+class ScriptedSession:
+    """Stand-in for the Prosp session: answers posts with scripted status codes."""
+
+    def __init__(self, status_codes):
+        self.status_codes = list(status_codes)
+        self.calls = 0
+
+    def post(self, url, data=None, timeout=None):
+        self.calls += 1
+        return fake_response(self.status_codes.pop(0))
+
+
+def test_prosp_retry_pass_probes_again_after_failed_probe():
+    """In the retry pass a failed half-open probe waits out the cooldown and probes again."""
+    # One failure opens the breaker; first pass: 503 opens it, the next attempt is
+    # rejected and the lead is queued. Retry pass: probe 503 reopens it, the next
+    # attempt waits out the cooldown and its probe succeeds.
+    session = ScriptedSession([503, 503, 200])
+    saved = (campaign_pusher._prosp_session, campaign_pusher._prosp_cb, campaign_pusher._backoff)
+    campaign_pusher._prosp_session = session
+    campaign_pusher._prosp_cb = CircuitBreaker('Prosp', window=1, failure_threshold=0.5, cooldown=0.05)
+    campaign_pusher._backoff = lambda *args, **kwargs: 0
+    try:
+        result = campaign_pusher.push_to_prosp(
+            [{'linkedin_url': 'https://www.linkedin.com/in/jane-doe', 'person_first_name': 'Jane'}],
+            FakePipelineRun()
+        )
+    finally:
+        campaign_pusher._prosp_session, campaign_pusher._prosp_cb, campaign_pusher._backoff = saved
+
+    assert session.calls == 3
+    assert result['uploaded'] == 1
+    assert result['permanently_failed'] == 0
+
+
+def test_aimd_increases_after_clean_window():
+    """Each full window of successes adds `increase`, up to max_limit."""
+    limiter = AIMDLimiter(min_limit=1, max_limit=3, window=2)
+    assert limiter.limit == 1
+
+    for expected in (2, 3, 3):
+        for _ in range(2):
+            limiter.acquire()
+            limiter.release(fake_response(200))
+        assert limiter.limit == expected
+
+
+def test_aimd_decreases_on_failure():
+    """A 429/5xx or raised request multiplies the limit by `decrease`, floored at min_limit."""
+    limiter = AIMDLimiter(min_limit=1, max_limit=8, window=1)
+    for _ in range(7):
+        limiter.acquire()
+        limiter.release(fake_response(200))
+    assert limiter.limit == 8
+
+    limiter.acquire()
+    limiter.release(fake_response(429))
+    assert limiter.limit == 4
+
+    limiter.acquire()
+    limiter.release(None)
+    assert limiter.limit == 2
+
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release(fake_response(503))
+    assert limiter.limit == 1
+
+
+def test_aimd_blocks_at_limit():
+    """acquire() waits while the in-flight count is at the limit."""
+    limiter = AIMDLimiter(min_limit=1, max_limit=2, window=10)
+    limiter.acquire()
+
+    acquired = threading.Event()
+
+    def second():
+        limiter.acquire()
+        acquired.set()
+
+    thread = threading.Thread(target=second, daemon=True)
+    thread.start()
+    assert not acquired.wait(0.1)  # Blocked: one in flight, limit 1
+
+    limiter.release(fake_response(200))
+    assert acquired.wait(1)
+    limiter.release(fake_response(200))
+    thread.join(1)
+
+
+def test_token_bucket_bursts_then_paces():
+    """Up to `capacity` acquires pass at once; later ones are spaced at 1/rate."""
+    bucket = TokenBucket(rate=20, capacity=2)
+
+    start = time.monotonic()
+    bucket.acquire()
+    bucket.acquire()
+    assert time.monotonic() - start < 0.03  # Burst
+
+    start = time.monotonic()
+    for _ in range(3):
+        bucket.acquire()
+    assert time.monotonic() - start >= 0.12  # ~3 x 50ms
+
+
+def test_token_bucket_throttle_and_relax():
+    """throttle() cuts the rate (floored at min_rate); relax() grows it back to the ceiling."""
+    bucket = TokenBucket(rate=4, min_rate=1)
+
+    bucket.throttle()
+    assert bucket.rate == 2
+    bucket.throttle(0.1)
+    assert bucket.rate == 1
+
+    bucket.relax(3)
+    assert bucket.rate == 3
+    bucket.relax(3)
+    assert bucket.rate == 4
+
+
+def test_token_bucket_throttle_slows_acquire():
+    """After throttle() the bucket refills at the lower rate."""
+    bucket = TokenBucket(rate=50, capacity=1, min_rate=1)
+    bucket.acquire()
+    bucket.throttle(0.2)  # 10/s
+
+    start = time.monotonic()
+    bucket.acquire()
+    assert time.monotonic() - start >= 0.08
+
+
+def test_token_bucket_adjusts_while_a_worker_waits():
+    """throttle()/relax() don't block behind a worker sleeping in acquire()."""
+    bucket = TokenBucket(rate=0.5, capacity=1)  # Next token in ~2s
+    bucket.acquire()
+
+    waiter = threading.Thread(target=bucket.acquire, daemon=True)
+    waiter.start()
+    time.sleep(0.05)  # Let the waiter start sleeping
+
+    start = time.monotonic()
+    bucket.throttle()
+    assert time.monotonic() - start < 0.05
+
+    bucket.relax(100)  # Back to 0.5/s: the waiter still gets its token
+    waiter.join(3)
+    assert not waiter.is_alive()
+
+
+TESTS = [
+    test_breaker_opens_on_failure_rate,
+    test_breaker_stays_closed_below_threshold,
+    test_breaker_half_open_probe_closes_on_success,
+    test_breaker_half_open_probe_reopens_on_failure,
+    test_prosp_retry_pass_probes_again_after_failed_probe,
+    test_aimd_increases_after_clean_window,
+    test_aimd_decreases_on_failure,
+    test_aimd_blocks_at_limit,
+    test_token_bucket_bursts_then_paces,
+    test_token_bucket_throttle_and_relax,
+    test_token_bucket_throttle_slows_acquire,
+    test_token_bucket_adjusts_while_a_worker_waits,
+]
+
+
+if __name__ == '__main__':
+    failed = 0
+    for test in TESTS:
+        try:
+            test()
+            print(f'[PASS] {test.__name__}')
+        except AssertionError as e:
+            failed += 1
+            print(f'[FAIL] {test.__name__}: {e}')
+    sys.exit(1 if failed else 0)